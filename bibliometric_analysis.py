@@ -12,7 +12,7 @@ Features:
 - Backbone extraction (Disparity Filter)
 - Temporal evolution analysis (Sankey diagram data)
 - Core authors identification by thematic cluster
-- Burst detection (Z-score based Kleinberg approximation)
+- Burst detection (Z-score based Kleinberg approximation, or two-state Kleinberg)
 - Pre-calculated network attributes for Gephi
 
 Author: Bibliometric Analysis Tool
@@ -23,9 +23,16 @@ Libraries: pandas, networkx, numpy, scipy
 import os
 import sys
 import argparse
-import math
+import hashlib
+import heapq
+import pickle
+import random
+import time
+from bisect import bisect_left
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from itertools import combinations
+from xml.etree import ElementTree
 import warnings
 
 warnings.filterwarnings('ignore')
@@ -51,6 +58,7 @@ except ImportError:
 
 try:
     from scipy import stats
+    from scipy import sparse
 except ImportError:
     print("Error: scipy library not installed. Run: pip install scipy")
     sys.exit(1)
@@ -67,6 +75,22 @@ except ImportError:
 
 import re
 
+# Try importing pyarrow (optional, for the on-disk corpus cache)
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Try importing leidenalg (optional, for Leiden community detection)
+try:
+    import igraph as ig
+    import leidenalg
+    LEIDEN_AVAILABLE = True
+except ImportError:
+    LEIDEN_AVAILABLE = False
+
 # Try importing BERTopic (optional, for semantic analysis)
 try:
     from bertopic import BERTopic
@@ -83,21 +107,106 @@ except ImportError:
 
 DEFAULT_DATA_DIR = "./"
 DEFAULT_OUTPUT_DIR = "./output"
+DEFAULT_CACHE_DIR = "./.bibliometric_cache"
+CACHE_VERSION = 1  # Bump when loading/preprocessing semantics change
+LOAD_WORKERS = os.cpu_count() or 1  # Worker processes for parsing export files
+AGGREGATES_FILE = "aggregates.pkl"
+AGGREGATES_VERSION = 6  # Bump when the aggregate layout changes
 TOP_N_SOURCES = 15
 TOP_N_AUTHORS = 15
 TOP_N_KEYWORDS = 50
 MIN_KEYWORD_FREQ = 2
 BACKBONE_ALPHA = 0.05  # Significance level for disparity filter
 N_TIME_PERIODS = 3
+WINDOW_SIZE = 3  # Years per sliding window
+WINDOW_STRIDE = 1  # Years between sliding window starts
 BURST_ZSCORE_THRESHOLD = 2.0
+BURST_ENGINE = "zscore"  # zscore, or kleinberg (adds burst start/end/strength)
+KLEINBERG_S = 2.0  # Burst state rate multiplier
+KLEINBERG_GAMMA = 1.0  # Cost of entering the burst state (x ln of the number of years)
 TOP_AUTHORS_PER_CLUSTER = 10
+RPYS_MIN_YEAR = 1900  # Earliest cited-reference year counted by RPYS
+RPYS_MAX_YEAR = 2025  # Latest plausible cited-reference year
+RPYS_WINDOW = 5  # Years in the centered moving median
+RPYS_TOP_REFERENCES = 3  # Most cited references reported per year
+RPYS_CHUNK_SIZE = 1 << 20  # Reference occurrences folded per histogram update
+BETWEENNESS_MODE = "auto"  # exact, approximate, or auto (approximate above the size threshold)
+BETWEENNESS_EXACT_MAX_NODES = 2000  # Largest network that gets exact betweenness in auto mode
+BETWEENNESS_SAMPLES = 500  # Pivot nodes (k) for approximate betweenness
+BETWEENNESS_SEED = 42
+CENTRALITY_WORKERS = os.cpu_count() or 1  # Worker processes for betweenness
+MAIN_PATH_WEIGHT = "spc"  # Search path weighting: spc (Search Path Count) or splc (Search Path Link Count)
+MAIN_PATH_TYPE = "key-route"  # Path reported as main_path_papers.csv: local, global, or key-route
+MAIN_PATH_KEY_ROUTES = 10  # Heaviest edges seeding the key-route main path
+PARALLEL_CENTRALITY_MIN_NODES = 500  # Smaller networks are not worth the process start-up
+COMMUNITY_ENGINE = "louvain"  # louvain, leiden (requires leidenalg), or greedy
+COMMUNITY_ENGINES = ('louvain', 'leiden', 'greedy')
+COMMUNITY_RESOLUTION = 1.0
+COMMUNITY_SEED = 42
 
 
 # =============================================================================
 # DATA LOADING MODULE
 # =============================================================================
 
-def load_wos_files(data_dir: str) -> pd.DataFrame:
+def read_export_file(task: tuple) -> tuple:
+    """
+    Parse one export file; runs inside a worker process.
+    
+    Args:
+        task: (filepath, read_csv keyword arguments)
+    
+    Returns:
+        (DataFrame, None) on success or (None, error message) on failure
+    """
+    filepath, read_kwargs = task
+    if PYARROW_AVAILABLE:
+        try:
+            df = pd.read_csv(filepath, encoding='utf-8', dtype=str, on_bad_lines='skip',
+                             engine='pyarrow', **read_kwargs)
+            if len(df) > 0:
+                return df, None
+        except Exception:
+            pass
+    
+    # The C parser decides rejections (and their messages) for files the
+    # pyarrow engine rejects or reads as empty, exactly as the serial loader did
+    try:
+        df = pd.read_csv(filepath, encoding='utf-8', dtype=str, on_bad_lines='skip', **read_kwargs)
+        return df, None
+    except Exception as e:
+        return None, str(e)
+
+
+def read_export_files(data_dir: str, filenames: list, read_kwargs: dict,
+                      workers: int = LOAD_WORKERS) -> list:
+    """
+    Parse export files concurrently on a process pool.
+    
+    Per-file results are reported and returned in the order of `filenames`,
+    so the concatenated frame is deterministic regardless of worker timing.
+    """
+    tasks = [(os.path.join(data_dir, f), read_kwargs) for f in filenames]
+    workers = max(1, min(workers, len(tasks)))
+    
+    if workers == 1:
+        results = [read_export_file(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(read_export_file, tasks))
+    
+    all_dfs = []
+    for filename, (df, error) in zip(filenames, results):
+        if error is None:
+            print(f"    ✓ {filename}: {len(df)} records")
+            all_dfs.append(df)
+        else:
+            print(f"    ✗ {filename}: Failed - {error[:50]}")
+    
+    return all_dfs
+
+
+def load_wos_files(data_dir: str, workers: int = LOAD_WORKERS) -> pd.DataFrame:
     """Load all Web of Science .txt files (data-wos-*.txt) from the specified directory."""
     # Only load files matching data-wos-*.txt pattern
     txt_files = [f for f in os.listdir(data_dir) if f.startswith('data-wos-') and f.endswith('.txt')]
@@ -107,18 +216,9 @@ def load_wos_files(data_dir: str) -> pd.DataFrame:
     
     print(f"  Found {len(txt_files)} WoS files")
     
-    all_dfs = []
-    
-    for filename in sorted(txt_files):
-        filepath = os.path.join(data_dir, filename)
-        try:
-            df = pd.read_csv(filepath, sep='\t', encoding='utf-8', 
-                           dtype=str, on_bad_lines='skip')
-            df['_source'] = 'WoS'
-            print(f"    ✓ {filename}: {len(df)} records")
-            all_dfs.append(df)
-        except Exception as e:
-            print(f"    ✗ {filename}: Failed - {str(e)[:50]}")
+    all_dfs = read_export_files(data_dir, sorted(txt_files), {'sep': '\t'}, workers)
+    for df in all_dfs:
+        df['_source'] = 'WoS'
     
     if not all_dfs:
         return pd.DataFrame()
@@ -127,7 +227,7 @@ def load_wos_files(data_dir: str) -> pd.DataFrame:
     return combined_df
 
 
-def load_scopus_files(data_dir: str) -> pd.DataFrame:
+def load_scopus_files(data_dir: str, workers: int = LOAD_WORKERS) -> pd.DataFrame:
     """Load all Scopus .csv files (data-scopus-*.csv) and normalize to WoS schema."""
     csv_files = [f for f in os.listdir(data_dir) if f.startswith('data-scopus-') and f.endswith('.csv')]
     
@@ -136,22 +236,18 @@ def load_scopus_files(data_dir: str) -> pd.DataFrame:
     
     print(f"  Found {len(csv_files)} Scopus files")
     
-    all_dfs = []
-    
-    for filename in sorted(csv_files):
-        filepath = os.path.join(data_dir, filename)
-        try:
-            df = pd.read_csv(filepath, encoding='utf-8', dtype=str, on_bad_lines='skip')
-            print(f"    ✓ {filename}: {len(df)} records")
-            all_dfs.append(df)
-        except Exception as e:
-            print(f"    ✗ {filename}: Failed - {str(e)[:50]}")
+    all_dfs = read_export_files(data_dir, sorted(csv_files), {}, workers)
     
     if not all_dfs:
         return pd.DataFrame()
     
     scopus_df = pd.concat(all_dfs, ignore_index=True)
     
+    return normalize_scopus_columns(scopus_df)
+
+
+def normalize_scopus_columns(scopus_df: pd.DataFrame) -> pd.DataFrame:
+    """Rename Scopus export columns to the WoS field tags and tag the source."""
     # Normalize Scopus columns to WoS schema
     column_mapping = {
         'Title': 'TI',
@@ -214,7 +310,7 @@ def normalize_title(title_value) -> str:
     return title if len(title) > 10 else None
 
 
-def load_combined_data(data_dir: str) -> pd.DataFrame:
+def load_combined_data(data_dir: str, workers: int = LOAD_WORKERS) -> pd.DataFrame:
     """
     Load and combine WoS and Scopus data with deduplication.
     
@@ -229,11 +325,11 @@ def load_combined_data(data_dir: str) -> pd.DataFrame:
     
     # Load both sources
     print("\n  Loading Web of Science data...")
-    wos_df = load_wos_files(data_dir)
+    wos_df = load_wos_files(data_dir, workers)
     wos_count = len(wos_df) if not wos_df.empty else 0
     
     print("\n  Loading Scopus data...")
-    scopus_df = load_scopus_files(data_dir)
+    scopus_df = load_scopus_files(data_dir, workers)
     scopus_count = len(scopus_df) if not scopus_df.empty else 0
     
     # Handle case where only one source is available
@@ -295,9 +391,110 @@ def load_combined_data(data_dir: str) -> pd.DataFrame:
     return combined_df
 
 
-def load_wos_data(data_dir: str) -> pd.DataFrame:
-    """Legacy function - now calls load_combined_data for backwards compatibility."""
-    return load_combined_data(data_dir)
+# =============================================================================
+# CORPUS CACHE MODULE
+# =============================================================================
+
+def list_input_files(data_dir: str) -> list:
+    """List the WoS (data-wos-*.txt) and Scopus (data-scopus-*.csv) exports in data_dir."""
+    return sorted(
+        f for f in os.listdir(data_dir)
+        if (f.startswith('data-wos-') and f.endswith('.txt'))
+        or (f.startswith('data-scopus-') and f.endswith('.csv'))
+    )
+
+
+def compute_input_fingerprint(data_dir: str, params: str = '') -> str:
+    """
+    Content hash of all input exports plus the preprocessing parameters.
+    
+    Any added, removed or modified export file yields a new fingerprint,
+    which invalidates the cache automatically.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{CACHE_VERSION}|{params}".encode('utf-8'))
+    
+    for filename in list_input_files(data_dir):
+        file_digest = file_fingerprint(os.path.join(data_dir, filename))
+        digest.update(f"{filename}|{file_digest}|".encode('utf-8'))
+    
+    return digest.hexdigest()
+
+
+def file_fingerprint(filepath: str) -> str:
+    """Content hash of a single export file."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filepath, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_cached_corpus(cache_dir: str, fingerprint: str) -> pd.DataFrame:
+    """Memory-map a cached corpus (Arrow IPC) if one exists for this fingerprint."""
+    cache_path = os.path.join(cache_dir, f"corpus-{fingerprint}.arrow")
+    if not PYARROW_AVAILABLE or not os.path.exists(cache_path):
+        return None
+    
+    try:
+        table = feather.read_table(cache_path, memory_map=True)
+        return table.to_pandas()
+    except Exception as e:
+        print(f"  Warning: Could not read corpus cache: {str(e)[:50]}")
+        return None
+
+
+def save_cached_corpus(df: pd.DataFrame, cache_dir: str, fingerprint: str):
+    """Write the corpus to the cache as uncompressed Arrow IPC, removing stale entries."""
+    if not PYARROW_AVAILABLE:
+        return
+    
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for filename in os.listdir(cache_dir):
+            if filename.startswith('corpus-') and filename.endswith('.arrow'):
+                os.remove(os.path.join(cache_dir, filename))
+        
+        cache_path = os.path.join(cache_dir, f"corpus-{fingerprint}.arrow")
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        feather.write_feather(table, cache_path, compression='uncompressed')
+        print(f"  ✓ Corpus cached to: {cache_path}")
+    except Exception as e:
+        print(f"  Warning: Could not write corpus cache: {str(e)[:50]}")
+
+
+def load_preprocessed_data(data_dir: str, cache_dir: str = DEFAULT_CACHE_DIR,
+                           exclude_year: int = 2026, workers: int = LOAD_WORKERS) -> pd.DataFrame:
+    """
+    Load, deduplicate and preprocess the corpus, reusing the on-disk cache when valid.
+    
+    Args:
+        data_dir: Directory with data-wos-*.txt / data-scopus-*.csv exports
+        cache_dir: Cache directory, or None to disable caching
+        exclude_year: Passed through to preprocess_data
+        workers: Worker processes for parsing export files
+    """
+    use_cache = cache_dir is not None and PYARROW_AVAILABLE
+    if cache_dir is not None and not PYARROW_AVAILABLE:
+        print("\n  Note: pyarrow not installed, corpus cache disabled. Run: pip install pyarrow")
+    
+    if use_cache:
+        fingerprint = compute_input_fingerprint(data_dir, f"exclude_year={exclude_year}")
+        df = load_cached_corpus(cache_dir, fingerprint)
+        if df is not None:
+            print("\n" + "=" * 70)
+            print("DATA LOADING (cached)")
+            print("=" * 70)
+            print(f"  Loaded {len(df)} preprocessed records from cache ({fingerprint[:12]})")
+            return df
+    
+    df = load_combined_data(data_dir, workers)
+    df = preprocess_data(df, exclude_year=exclude_year)
+    
+    if use_cache:
+        save_cached_corpus(df, cache_dir, fingerprint)
+    
+    return df
 
 
 # =============================================================================
@@ -365,13 +562,6 @@ def parse_keywords(kw_field) -> list:
     return [k.strip().upper() for k in str(kw_field).split(';') if k.strip() and len(k.strip()) > 2]
 
 
-def parse_references(cr_field) -> list:
-    """Parse references field from WoS format."""
-    if pd.isna(cr_field) or not cr_field:
-        return []
-    return [r.strip()[:50].upper() for r in str(cr_field).split(';') if r.strip()]
-
-
 def extract_country_from_affiliation(affiliation: str) -> str:
     """Extract country from affiliation string."""
     if pd.isna(affiliation) or not affiliation:
@@ -390,6 +580,301 @@ def extract_country_from_affiliation(affiliation: str) -> str:
     return None
 
 
+def parse_countries(c1_field) -> list:
+    """Parse the distinct countries of a record from its C1 affiliations field."""
+    affiliations = str(c1_field) if pd.notna(c1_field) else ''
+    aff_list = affiliations.replace('[', ';').replace(']', ';').split(';')
+    
+    record_countries = {}
+    for aff in aff_list:
+        if aff.strip():
+            country = extract_country_from_affiliation(aff.strip())
+            if country and len(country) > 1:
+                record_countries[country] = None
+    return list(record_countries)
+
+
+def parse_int_field(value) -> int:
+    """Parse a numeric WoS field (PY, TC) to int, returning 0 if missing or invalid."""
+    try:
+        return int(float(value)) if pd.notna(value) else 0
+    except (ValueError, TypeError, OverflowError):
+        return 0
+
+
+def rank_keywords(keyword_counts: dict, top_n: int) -> list:
+    """
+    Top-n (keyword, count) pairs by descending count.
+    
+    Ties are broken alphabetically, so the ranking does not depend on the
+    order in which records were read.
+    """
+    return heapq.nsmallest(top_n, keyword_counts.items(), key=lambda x: (-x[1], x[0]))
+
+
+class InternedField:
+    """
+    Multi-valued record field with tokens interned to integer IDs.
+    
+    Stored in CSR form: the token IDs of record i are
+    values[offsets[i]:offsets[i + 1]] and names[token_id] recovers the string.
+    IDs are assigned in order of first appearance.
+    """
+    
+    def __init__(self, token_lists):
+        index = {}
+        offsets = [0]
+        values = []
+        for tokens in token_lists:
+            for token in tokens:
+                values.append(index.setdefault(token, len(index)))
+            offsets.append(len(values))
+        
+        self.index = index
+        self.names = list(index)
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self.values = np.array(values, dtype=np.int32)
+    
+    @property
+    def n_records(self) -> int:
+        return len(self.offsets) - 1
+    
+    @property
+    def n_tokens(self) -> int:
+        return len(self.names)
+    
+    def ids(self, i: int) -> list:
+        """Token IDs of record i."""
+        return self.values[self.offsets[i]:self.offsets[i + 1]].tolist()
+    
+    def tokens(self, i: int) -> list:
+        """Token strings of record i."""
+        return [self.names[t] for t in self.ids(i)]
+    
+    def lengths(self) -> np.ndarray:
+        """Number of tokens per record."""
+        return np.diff(self.offsets)
+    
+    def value_records(self) -> np.ndarray:
+        """Record index of each entry in `values`."""
+        return np.repeat(np.arange(self.n_records), self.lengths())
+    
+    def counts(self) -> np.ndarray:
+        """Total occurrences of each token ID."""
+        return np.bincount(self.values, minlength=self.n_tokens)
+    
+    def matrix(self) -> 'sparse.csr_matrix':
+        """Record x token incidence matrix (repeated tokens are summed).
+        
+        The CSR arrays are copied because scipy may sort them in place.
+        """
+        X = sparse.csr_matrix(
+            (np.ones(len(self.values), dtype=np.int32), self.values.copy(), self.offsets.copy()),
+            shape=(self.n_records, self.n_tokens)
+        )
+        X.sum_duplicates()
+        return X
+
+
+class ParsedCorpus:
+    """
+    Tokenized view of the preprocessed dataset, built once and shared by all analyses.
+    
+    Arrays are aligned with the DataFrame rows:
+    - years, citations: int arrays from PY and TC (0 when missing)
+    - authors: AU, in order, via parse_authors
+    - keywords: distinct DE + ID keywords via parse_keywords
+    - references: stripped CR entries, in order (full strings); their
+      structured fields are parsed once into `cited`
+    - countries: distinct countries from C1
+    """
+    
+    def __init__(self, df: pd.DataFrame):
+        n = len(df)
+        
+        def column(name):
+            return df[name].tolist() if name in df.columns else [None] * n
+        
+        self.n_records = n
+        self.years = np.array([parse_int_field(v) for v in column('PY')], dtype=np.int32)
+        self.citations = np.array([parse_int_field(v) for v in column('TC')], dtype=np.int64)
+        self.authors = InternedField(parse_authors(v) for v in column('AU'))
+        self.keywords = InternedField(
+            dict.fromkeys(parse_keywords(de) + parse_keywords(kw_id))
+            for de, kw_id in zip(column('DE'), column('ID'))
+        )
+        self.references = InternedField(
+            [r.strip() for r in str(cr).split(';') if r.strip()] if pd.notna(cr) and cr else []
+            for cr in column('CR')
+        )
+        self.countries = InternedField(parse_countries(v) for v in column('C1'))
+        self._cited = None
+    
+    @property
+    def cited(self) -> 'CitedReferences':
+        """Structured fields of the distinct references, parsed on first use."""
+        if self._cited is None:
+            self._cited = CitedReferences(self.references.names)
+        return self._cited
+
+
+DOI_PATTERN = re.compile(r'10\.\d{4,}/[^\s,;]+', re.IGNORECASE)
+REF_YEAR_PATTERN = re.compile(r'\b(19\d{2}|20\d{2})\b')
+SURNAME_PATTERN = re.compile(r'^([A-Z][A-Z\'\-]+)')
+# WoS: "AMIT R, 1998, J BUS VENTURING, V13, P441, DOI 10.1016/..."
+WOS_REFERENCE_PATTERN = re.compile(
+    r'^[^,]*,\s*\d{4}(?:,\s*(?P<source>(?!V\d|P\d|DOI )[^,]*))?'
+    r'(?:,\s*V(?P<volume>[^,]*))?(?:,\s*P(?P<page>[^,]*))?'
+)
+# Scopus: "Abreu M., Grinevich V., Title, (2013) Research Policy, 42 (2), pp. 408-422"
+NON_ALNUM_PATTERN = re.compile(r'[^0-9A-Z]+')
+SCOPUS_REFERENCE_PATTERN = re.compile(
+    r'\(\d{4}\)\s*(?P<source>[^,]*)(?:,\s*(?P<volume>\d+))?(?:\s*\([^)]*\))?'
+    r'(?:,\s*PP?\.\s*(?P<page>[^,\s-]+))?'
+)
+
+
+def parse_cited_reference(ref_string: str) -> dict:
+    """
+    Split one WoS or Scopus cited-reference string into structured fields.
+    
+    Returns a dict with first_author (upper-cased text before the first
+    comma), surname, multi_field (more than one comma-separated field), year
+    (first 19xx/20xx in the string, 0 if none), source, volume, page and doi
+    (lower-cased); missing text fields are ''.
+    """
+    ref_str = str(ref_string)
+    ref_upper = ref_str.upper()
+    
+    parts = ref_upper.split(',', 1)
+    first_author = parts[0].strip()
+    surname_match = SURNAME_PATTERN.match(first_author)
+    year_match = REF_YEAR_PATTERN.search(ref_upper)
+    doi_match = DOI_PATTERN.search(ref_str)
+    
+    fields = WOS_REFERENCE_PATTERN.match(ref_upper) or SCOPUS_REFERENCE_PATTERN.search(ref_upper)
+    
+    def field(name):
+        value = fields.group(name) if fields else None
+        return value.strip() if value else ''
+    
+    return {
+        'first_author': first_author,
+        'surname': surname_match.group(1) if surname_match else '',
+        'multi_field': len(parts) > 1,
+        'year': int(year_match.group(1)) if year_match else 0,
+        'source': field('source'),
+        'volume': field('volume'),
+        'page': field('page'),
+        'doi': doi_match.group(0).lower().strip() if doi_match else ''
+    }
+
+
+def normalize_reference_text(text: str) -> str:
+    """Upper-case alphanumeric tokens of a reference field, single-spaced."""
+    return ' '.join(NON_ALNUM_PATTERN.sub(' ', text.upper()).split())
+
+
+def canonical_reference_key(ref_string: str, parsed: dict) -> tuple:
+    """
+    Bibliographic key of a parsed reference: (normalized first author, year,
+    source, volume, page), or the normalized full string when the year or
+    source could not be parsed.
+    """
+    if parsed['year'] and parsed['source']:
+        return ('REF', normalize_reference_text(parsed['first_author']), parsed['year'],
+                normalize_reference_text(parsed['source']), normalize_reference_text(parsed['volume']),
+                normalize_reference_text(parsed['page']))
+    return ('RAW', normalize_reference_text(ref_string))
+
+
+class ReferenceInterner:
+    """
+    Assigns integer IDs to cited works, independently of reading order.
+    
+    intern() gives every DOI and every bibliographic key without DOI its own
+    stable raw ID; the grouping into works is resolved by canonical_ids().
+    A DOI identifies a work on its own. References without DOI belong to
+    the work of the lexicographically smallest DOI seen with the same
+    bibliographic key, or form their own work when no DOI carries that key.
+    The equivalence classes therefore depend only on the set of references
+    interned, not on their order, so incremental batches and a full run
+    group works identically. Kept across batches by the incremental
+    aggregates.
+    """
+    
+    def __init__(self):
+        self.ids = {}       # ('DOI', doi) or bibliographic key -> raw ID
+        self.key_doi = {}   # bibliographic key -> smallest DOI seen with it
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def intern(self, doi: str, key: tuple) -> int:
+        """Raw ID of a reference: its DOI, or its bibliographic key when it has none."""
+        if doi:
+            if key not in self.key_doi or doi < self.key_doi[key]:
+                self.key_doi[key] = doi
+            key = ('DOI', doi)
+        return self.ids.setdefault(key, len(self.ids))
+    
+    def canonical_ids(self) -> np.ndarray:
+        """Work of each raw ID, as the raw ID representing it (int64 array)."""
+        mapping = np.arange(len(self.ids), dtype=np.int64)
+        for key, doi in self.key_doi.items():
+            key_id = self.ids.get(key)
+            if key_id is not None:
+                mapping[key_id] = self.ids[('DOI', doi)]
+        return mapping
+
+
+class CitedReferences:
+    """
+    Structured fields of every distinct cited-reference string, parsed once.
+    
+    Columns are aligned with the distinct reference strings
+    (corpus.references.names); see parse_cited_reference for the fields.
+    Years are an int32 array, text fields are lists. keys holds each
+    string's canonical_reference_key and canonical_ids (int32) the cited
+    work it denotes, so spelling variants of the same work share an ID.
+    """
+    
+    FIELDS = ('first_author', 'surname', 'multi_field', 'source', 'volume', 'page', 'doi')
+    
+    def __init__(self, names: list):
+        columns = {name: [] for name in self.FIELDS}
+        years = []
+        self.keys = []
+        for ref in names:
+            parsed = parse_cited_reference(ref)
+            for name in self.FIELDS:
+                columns[name].append(parsed[name])
+            years.append(parsed['year'])
+            self.keys.append(canonical_reference_key(ref, parsed))
+        
+        for name in self.FIELDS:
+            setattr(self, name, columns[name])
+        self.year = np.array(years, dtype=np.int32)
+        
+        interner = ReferenceInterner()
+        raw_ids = np.array([interner.intern(doi, key) for doi, key in zip(self.doi, self.keys)], dtype=np.int64)
+        works, canonical_ids = np.unique(interner.canonical_ids()[raw_ids], return_inverse=True)
+        self.canonical_ids = canonical_ids.ravel().astype(np.int32)
+        self.n_canonical = len(works)
+    
+    def __len__(self) -> int:
+        return len(self.year)
+
+
+def build_parsed_corpus(df: pd.DataFrame) -> ParsedCorpus:
+    """Parse all multi-valued fields once after preprocessing."""
+    print("\n  Parsing records (authors, keywords, references)...")
+    corpus = ParsedCorpus(df)
+    print(f"    {corpus.authors.n_tokens} authors, {corpus.keywords.n_tokens} keywords, "
+          f"{corpus.references.n_tokens} distinct references ({corpus.cited.n_canonical} cited works)")
+    return corpus
+
+
 # =============================================================================
 # QUANTITATIVE ANALYSIS MODULE
 # =============================================================================
@@ -417,48 +902,42 @@ def analyze_top_sources(df: pd.DataFrame, top_n: int = TOP_N_SOURCES) -> pd.Data
     })
 
 
-def analyze_top_cited_authors(df: pd.DataFrame, top_n: int = TOP_N_AUTHORS) -> pd.DataFrame:
+def analyze_top_cited_authors(df: pd.DataFrame, top_n: int = TOP_N_AUTHORS,
+                              corpus: ParsedCorpus = None) -> pd.DataFrame:
     """Identify most cited authors in the dataset."""
-    author_citations = defaultdict(int)
-    author_papers = defaultdict(int)
-    
-    for _, row in df.iterrows():
-        authors = parse_authors(row.get('AU', ''))
-        try:
-            citations = int(float(row.get('TC', 0))) if pd.notna(row.get('TC')) else 0
-        except (ValueError, TypeError):
-            citations = 0
-        
-        for author in authors:
-            if author:
-                author_citations[author] += citations
-                author_papers[author] += 1
-    
-    sorted_authors = sorted(author_citations.items(), key=lambda x: x[1], reverse=True)[:top_n]
-    
-    result_df = pd.DataFrame(sorted_authors, columns=['Author', 'Total Citations'])
-    result_df['Papers'] = result_df['Author'].map(author_papers)
+    if corpus is None:
+        corpus = ParsedCorpus(df)
+    
+    authors = corpus.authors
+    author_citations = np.bincount(
+        authors.values, weights=corpus.citations[authors.value_records()], minlength=authors.n_tokens
+    ).round().astype(np.int64)
+    author_papers = np.bincount(authors.values, minlength=authors.n_tokens)
+    
+    # Stable sort keeps first-appearance order among ties
+    top_ids = np.argsort(-author_citations, kind='stable')[:top_n]
+    
+    result_df = pd.DataFrame({
+        'Author': [authors.names[i] for i in top_ids],
+        'Total Citations': author_citations[top_ids],
+        'Papers': author_papers[top_ids]
+    })
     result_df['Avg Citations'] = (result_df['Total Citations'] / result_df['Papers']).round(1)
     result_df.insert(0, 'Rank', range(1, len(result_df) + 1))
     
     return result_df
 
 
-def analyze_country_collaboration(df: pd.DataFrame) -> tuple:
+def analyze_country_collaboration(df: pd.DataFrame, corpus: ParsedCorpus = None) -> tuple:
     """Analyze country distribution and collaboration."""
+    if corpus is None:
+        corpus = ParsedCorpus(df)
+    
     country_counts = Counter()
     country_collaborations = Counter()
     
-    for _, row in df.iterrows():
-        affiliations = str(row.get('C1', '')) if pd.notna(row.get('C1')) else ''
-        aff_list = affiliations.replace('[', ';').replace(']', ';').split(';')
-        
-        record_countries = set()
-        for aff in aff_list:
-            if aff.strip():
-                country = extract_country_from_affiliation(aff.strip())
-                if country and len(country) > 1:
-                    record_countries.add(country)
+    for i in range(corpus.n_records):
+        record_countries = corpus.countries.tokens(i)
         
         for country in record_countries:
             country_counts[country] += 1
@@ -483,39 +962,108 @@ def analyze_country_collaboration(df: pd.DataFrame) -> tuple:
 # NETWORK ANALYSIS MODULE - BASIC
 # =============================================================================
 
-def build_keyword_cooccurrence_network(df: pd.DataFrame, top_n: int = TOP_N_KEYWORDS) -> nx.Graph:
-    """Build keyword co-occurrence network."""
-    print("\n  Building keyword co-occurrence network...")
+def keyword_graph_from_counts(top_keywords: list, pair_counts: dict, min_weight: int,
+                              with_label: bool = False) -> nx.Graph:
+    """
+    Assemble a keyword co-occurrence graph from precomputed counts.
     
-    all_keywords = Counter()
-    record_keywords = []
+    Args:
+        top_keywords: Ranked (keyword, frequency) pairs that become the nodes
+        pair_counts: Co-occurrence counts keyed by sorted (kw1, kw2) pairs;
+            pairs outside top_keywords are ignored
+        min_weight: Minimum co-occurrence count for an edge
+        with_label: Also set the 'label' node attribute (for Gephi)
+    """
+    top_set = {kw for kw, _ in top_keywords}
     
-    for _, row in df.iterrows():
-        keywords = set()
-        keywords.update(parse_keywords(row.get('DE', '')))
-        keywords.update(parse_keywords(row.get('ID', '')))
-        
-        if keywords:
-            record_keywords.append(keywords)
-            all_keywords.update(keywords)
+    G = nx.Graph()
+    
+    for kw, freq in top_keywords:
+        if with_label:
+            G.add_node(kw, frequency=freq, label=kw)
+        else:
+            G.add_node(kw, frequency=freq)
+    
+    for (kw1, kw2), weight in pair_counts.items():
+        if weight >= min_weight and kw1 in top_set and kw2 in top_set:
+            G.add_edge(kw1, kw2, weight=weight)
+    
+    return G
+
+
+def keyword_cooccurrence_matrix(X: 'sparse.csr_matrix', top_ids: list, min_weight: int = 1) -> tuple:
+    """
+    Co-occurrence counts among the top keywords from one sparse product.
     
-    top_keywords = {kw for kw, _ in all_keywords.most_common(top_n)}
+    Restricts the record x keyword matrix X to the top keyword columns and
+    takes the upper triangle of X^T X, thresholded on the sparse result.
+    
+    Returns:
+        (rows, cols, weights) arrays; rows/cols index top_ids and are
+        sorted lexicographically.
+    """
+    X = (X[:, top_ids] > 0).astype(np.int32)
     
-    cooccurrence = Counter()
-    for keywords in record_keywords:
-        filtered = keywords & top_keywords
-        for pair in combinations(sorted(filtered), 2):
-            cooccurrence[pair] += 1
+    return cooccurrence_coo(X.T @ X, min_weight)
+
+
+def cooccurrence_coo(C: 'sparse.spmatrix', min_weight: int = 1) -> tuple:
+    """Upper-triangle entries of a symmetric co-occurrence matrix with weight >= min_weight."""
+    C = sparse.triu(C, k=1).tocoo()
+    keep = C.data >= min_weight
+    rows, cols, weights = C.row[keep], C.col[keep], C.data[keep]
+    
+    order = np.lexsort((cols, rows))
+    return rows[order], cols[order], weights[order]
+
+
+def keyword_graph_from_coo(top_keywords: list, rows: np.ndarray, cols: np.ndarray,
+                           weights: np.ndarray, with_label: bool = False) -> nx.Graph:
+    """Build a keyword co-occurrence graph in bulk from COO arrays (see keyword_cooccurrence_matrix)."""
+    names = [kw for kw, _ in top_keywords]
     
     G = nx.Graph()
+    G.add_nodes_from(
+        (kw, {'frequency': freq, 'label': kw} if with_label else {'frequency': freq})
+        for kw, freq in top_keywords
+    )
+    G.add_weighted_edges_from(zip(
+        [names[r] for r in rows.tolist()],
+        [names[c] for c in cols.tolist()],
+        weights.tolist()
+    ))
+    
+    return G
+
+
+def build_keyword_cooccurrence_network(df: pd.DataFrame, top_n: int = TOP_N_KEYWORDS,
+                                       corpus: ParsedCorpus = None) -> nx.Graph:
+    """Build keyword co-occurrence network."""
+    print("\n  Building keyword co-occurrence network...")
     
-    for kw in top_keywords:
-        G.add_node(kw, frequency=all_keywords[kw], label=kw)
+    if corpus is None:
+        corpus = ParsedCorpus(df)
     
-    for (kw1, kw2), weight in cooccurrence.items():
-        if weight >= MIN_KEYWORD_FREQ:
-            G.add_edge(kw1, kw2, weight=weight)
+    keywords = corpus.keywords
+    all_keywords = dict(zip(keywords.names, keywords.counts().tolist()))
+    top_keywords = rank_keywords(all_keywords, top_n)
+    
+    top_ids = [keywords.index[kw] for kw, _ in top_keywords]
+    rows, cols, weights = keyword_cooccurrence_matrix(keywords.matrix(), top_ids, MIN_KEYWORD_FREQ)
+    G = keyword_graph_from_coo(top_keywords, rows, cols, weights, with_label=True)
+    
+    return remove_isolated_keywords(G)
+
+
+def keyword_cooccurrence_network_from_counts(top_keywords: list, pair_counts: dict) -> nx.Graph:
+    """Build the Gephi keyword network (MIN_KEYWORD_FREQ edges, no isolates) from counts."""
+    G = keyword_graph_from_counts(top_keywords, pair_counts, MIN_KEYWORD_FREQ, with_label=True)
     
+    return remove_isolated_keywords(G)
+
+
+def remove_isolated_keywords(G: nx.Graph) -> nx.Graph:
+    """Drop keywords without edges and report the network size."""
     isolated = list(nx.isolates(G))
     G.remove_nodes_from(isolated)
     
@@ -528,7 +1076,60 @@ def build_keyword_cooccurrence_network(df: pd.DataFrame, top_n: int = TOP_N_KEYW
 # ADVANCED NETWORK ANALYSIS - NORMALIZED COUPLING
 # =============================================================================
 
-def build_normalized_coupling_network(df: pd.DataFrame, min_papers: int = 2) -> nx.Graph:
+def compute_coupling_matrix(X: 'sparse.csr_matrix', min_shared: int = 2) -> tuple:
+    """
+    Compute coupling strengths for all author pairs with a single sparse product.
+    
+    Takes a binary author x reference incidence matrix X (CSR) and obtains the
+    shared-reference counts from the upper triangle of X * X^T, so only pairs
+    that actually share references are ever materialized.
+    
+    Returns:
+        (rows, cols, shared, normalized) arrays, where rows/cols index the rows
+        of X, shared is the raw count and normalized is Salton's Cosine.
+    """
+    empty = np.array([], dtype=np.int64)
+    if X.nnz == 0:
+        return empty, empty, empty, np.array([], dtype=float)
+    
+    coupling = sparse.triu(X @ X.T, k=1).tocoo()
+    keep = coupling.data >= min_shared
+    rows = coupling.row[keep].astype(np.int64)
+    cols = coupling.col[keep].astype(np.int64)
+    shared = coupling.data[keep].astype(np.int64)
+    
+    # Salton's Cosine normalization
+    n_refs = np.diff(X.indptr).astype(np.int64)
+    normalized = shared / np.sqrt((n_refs[rows] * n_refs[cols]).astype(float))
+    
+    return rows, cols, shared, normalized
+
+
+def build_author_reference_matrix(corpus: ParsedCorpus) -> 'sparse.csr_matrix':
+    """
+    Build the binary author x reference incidence matrix used for coupling.
+    
+    Columns are canonical reference IDs (CitedReferences.canonical_ids), so
+    variants of the same cited work count as one shared reference.
+    """
+    refs = corpus.references
+    cited = corpus.cited
+    
+    # Record x canonical-reference incidence
+    R = sparse.csr_matrix(
+        (np.ones(len(refs.values), dtype=np.int32), cited.canonical_ids[refs.values], refs.offsets.copy()),
+        shape=(corpus.n_records, cited.n_canonical)
+    )
+    
+    # Author x record incidence, then author x canonical reference
+    A = corpus.authors.matrix().T.tocsr()
+    X = (A @ R).tocsr()
+    X.data[:] = 1
+    return X
+
+
+def build_normalized_coupling_network(df: pd.DataFrame, min_papers: int = 2,
+                                      corpus: ParsedCorpus = None) -> nx.Graph:
     """
     Build bibliographic coupling network with Salton's Cosine normalization.
     
@@ -537,66 +1138,59 @@ def build_normalized_coupling_network(df: pd.DataFrame, min_papers: int = 2) ->
     """
     print("\n  Building normalized bibliographic coupling network...")
     
-    author_refs = defaultdict(set)
-    author_papers = Counter()
-    author_citations = defaultdict(int)
+    if corpus is None:
+        corpus = ParsedCorpus(df)
     
-    for _, row in df.iterrows():
-        authors = parse_authors(row.get('AU', ''))
-        refs = parse_references(row.get('CR', ''))
-        try:
-            citations = int(float(row.get('TC', 0))) if pd.notna(row.get('TC')) else 0
-        except (ValueError, TypeError):
-            citations = 0
-        
-        for author in authors:
-            if author:
-                author_refs[author].update(refs)
-                author_papers[author] += 1
-                author_citations[author] += citations
+    authors = corpus.authors
+    author_papers = authors.counts()
+    author_citations = np.bincount(
+        authors.values, weights=corpus.citations[authors.value_records()], minlength=authors.n_tokens
+    ).round().astype(np.int64)
     
     # Filter to authors with at least min_papers
-    active_authors = {a for a, count in author_papers.items() if count >= min_papers}
+    active_ids = sorted(
+        (i for i in range(authors.n_tokens) if author_papers[i] >= min_papers),
+        key=lambda i: authors.names[i]
+    )
     
-    # Calculate normalized coupling strength
-    coupling = {}
-    authors_list = list(active_authors)
+    X = build_author_reference_matrix(corpus)[active_ids]
     
-    for i, author1 in enumerate(authors_list):
-        refs1 = author_refs[author1]
-        len_refs1 = len(refs1)
-        if len_refs1 == 0:
-            continue
-            
-        for author2 in authors_list[i+1:]:
-            refs2 = author_refs[author2]
-            len_refs2 = len(refs2)
-            if len_refs2 == 0:
-                continue
-                
-            shared = len(refs1 & refs2)
-            if shared >= 2:  # Minimum coupling
-                # Salton's Cosine normalization
-                normalized_weight = shared / math.sqrt(len_refs1 * len_refs2)
-                coupling[(author1, author2)] = {
-                    'raw': shared,
-                    'normalized': normalized_weight
-                }
+    return coupling_graph_from_matrix(
+        [authors.names[i] for i in active_ids],
+        author_papers[active_ids].tolist(),
+        author_citations[active_ids].tolist(),
+        X
+    )
+
+
+def coupling_graph_from_matrix(authors: list, papers: list, citations: list,
+                               X: 'sparse.csr_matrix') -> nx.Graph:
+    """
+    Assemble the normalized coupling graph from an author x reference matrix.
+    
+    Args:
+        authors: Author names, one per row of X (already filtered by min_papers)
+        papers: Paper count per author
+        citations: Citation total per author
+        X: Binary author x reference incidence matrix
+    """
+    # Calculate normalized coupling strength from the sparse incidence matrix
+    rows, cols, shared, normalized = compute_coupling_matrix(X)
     
     # Create network
     G = nx.Graph()
     
-    for author in active_authors:
-        if any(author in pair for pair in coupling.keys()):
-            G.add_node(author, 
-                      papers=author_papers[author], 
-                      citations=author_citations[author],
-                      label=author)
+    coupled = np.unique(np.concatenate([rows, cols]))
+    for idx in coupled.tolist():
+        G.add_node(authors[idx], 
+                  papers=papers[idx], 
+                  citations=citations[idx],
+                  label=authors[idx])
     
-    for (a1, a2), weights in coupling.items():
-        G.add_edge(a1, a2, 
-                  weight=weights['normalized'],
-                  weight_raw=weights['raw'])
+    G.add_edges_from(
+        (authors[i], authors[j], {'weight': w, 'weight_raw': raw})
+        for i, j, raw, w in zip(rows.tolist(), cols.tolist(), shared.tolist(), normalized.tolist())
+    )
     
     isolated = list(nx.isolates(G))
     G.remove_nodes_from(isolated)
@@ -606,44 +1200,52 @@ def build_normalized_coupling_network(df: pd.DataFrame, min_papers: int = 2) ->
     return G
 
 
-def apply_disparity_filter(G: nx.Graph, alpha: float = BACKBONE_ALPHA) -> nx.Graph:
+def compute_disparity_alphas(G: nx.Graph) -> nx.Graph:
     """
-    Apply disparity filter (Serrano et al., 2009) for backbone extraction.
+    Store the disparity filter significance of every edge as its 'alpha' attribute.
     
-    Keeps edges that are statistically significant given the local topology.
+    Node strengths and degrees are computed once from the edge list and both
+    endpoint p-values, (1 - w/s)^(k-1), are evaluated for all edges at once.
+    An edge survives a threshold alpha if alpha >= its 'alpha' attribute, so
+    one pass serves any number of thresholds (see backbone_from_alphas).
     """
-    print(f"  Applying disparity filter (alpha={alpha})...")
-    
     if G.number_of_edges() == 0:
         return G
     
-    edges_to_remove = []
+    node_index = {node: i for i, node in enumerate(G.nodes())}
+    edges = list(G.edges(data='weight', default=1.0))
+    u = np.fromiter((node_index[a] for a, _, _ in edges), dtype=np.int64, count=len(edges))
+    v = np.fromiter((node_index[b] for _, b, _ in edges), dtype=np.int64, count=len(edges))
+    weight = np.fromiter((w for _, _, w in edges), dtype=np.float64, count=len(edges))
+    
+    n_nodes = len(node_index)
+    not_loop = u != v
+    strength = np.bincount(u, weights=weight, minlength=n_nodes) + \
+               np.bincount(v[not_loop], weights=weight[not_loop], minlength=n_nodes)
+    degree = np.bincount(u, minlength=n_nodes) + np.bincount(v, minlength=n_nodes)
+    
+    def endpoint_pvalues(endpoint):
+        s = strength[endpoint]
+        k = degree[endpoint]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            p = np.where(s > 0, weight / s, 0.0)
+            pval = np.power(1.0 - p, k - 1)
+        pval[(k <= 1) | ~np.isfinite(pval)] = 1.0
+        return pval
+    
+    # Edge is significant if it is significant for at least one endpoint
+    alphas = np.minimum(endpoint_pvalues(u), endpoint_pvalues(v))
+    
+    for (a, b, _), edge_alpha in zip(edges, alphas.tolist()):
+        G[a][b]['alpha'] = edge_alpha
     
-    for u, v, data in G.edges(data=True):
-        weight = data.get('weight', 1.0)
-        
-        # Calculate strength (sum of weights) for both nodes
-        strength_u = sum(G[u][neighbor].get('weight', 1.0) for neighbor in G.neighbors(u))
-        strength_v = sum(G[v][neighbor].get('weight', 1.0) for neighbor in G.neighbors(v))
-        
-        degree_u = G.degree(u)
-        degree_v = G.degree(v)
-        
-        # Normalized weight for each endpoint
-        p_u = weight / strength_u if strength_u > 0 else 0
-        p_v = weight / strength_v if strength_v > 0 else 0
-        
-        # P-value based on null model (uniform distribution)
-        # p-value = (1 - p)^(k-1) where k is degree
-        try:
-            pval_u = (1 - p_u) ** (degree_u - 1) if degree_u > 1 else 1.0
-            pval_v = (1 - p_v) ** (degree_v - 1) if degree_v > 1 else 1.0
-        except:
-            pval_u = pval_v = 1.0
-        
-        # Keep edge if significant for at least one endpoint
-        if pval_u > alpha and pval_v > alpha:
-            edges_to_remove.append((u, v))
+    return G
+
+
+def backbone_from_alphas(G: nx.Graph, alpha: float = BACKBONE_ALPHA) -> tuple:
+    """Keep edges whose disparity 'alpha' is within the threshold, dropping isolates."""
+    edges_to_remove = [(u, v) for u, v, edge_alpha in G.edges(data='alpha', default=1.0)
+                       if edge_alpha > alpha]
     
     G_backbone = G.copy()
     G_backbone.remove_edges_from(edges_to_remove)
@@ -652,8 +1254,26 @@ def apply_disparity_filter(G: nx.Graph, alpha: float = BACKBONE_ALPHA) -> nx.Gra
     isolated = list(nx.isolates(G_backbone))
     G_backbone.remove_nodes_from(isolated)
     
+    return G_backbone, len(edges_to_remove)
+
+
+def apply_disparity_filter(G: nx.Graph, alpha: float = BACKBONE_ALPHA) -> nx.Graph:
+    """
+    Apply disparity filter (Serrano et al., 2009) for backbone extraction.
+    
+    Keeps edges that are statistically significant given the local topology.
+    Per-edge significance is stored on G as the 'alpha' edge attribute.
+    """
+    print(f"  Applying disparity filter (alpha={alpha})...")
+    
+    if G.number_of_edges() == 0:
+        return G
+    
+    compute_disparity_alphas(G)
+    G_backbone, n_removed = backbone_from_alphas(G, alpha)
+    
     print(f"    After backbone: Nodes: {G_backbone.number_of_nodes()}, Edges: {G_backbone.number_of_edges()}")
-    print(f"    Edges removed: {len(edges_to_remove)}")
+    print(f"    Edges removed: {n_removed}")
     
     return G_backbone
 
@@ -679,13 +1299,77 @@ def extract_giant_component(G: nx.Graph) -> nx.Graph:
 # COMMUNITY DETECTION AND ENRICHMENT
 # =============================================================================
 
-def detect_communities(G: nx.Graph) -> dict:
-    """Detect communities using Louvain-like greedy modularity optimization."""
-    if G.number_of_nodes() == 0:
+community_cache = {}  # (graph fingerprint, engine label) -> partition, for the current run
+
+
+def graph_fingerprint(G: nx.Graph) -> str:
+    """Structural hash of a graph: node set, edge set and edge weights."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(b'directed' if G.is_directed() else b'undirected')
+    for node in sorted(map(repr, G.nodes())):
+        digest.update(node.encode('utf-8') + b'\0')
+    
+    edges = []
+    for u, v, w in G.edges(data='weight', default=1.0):
+        u, v = repr(u), repr(v)
+        if not G.is_directed() and v < u:
+            u, v = v, u
+        edges.append(f"{u}\0{v}\0{w!r}")
+    for edge in sorted(edges):
+        digest.update(edge.encode('utf-8') + b'\1')
+    
+    return digest.hexdigest()
+
+
+def detect_communities(G: nx.Graph, engine: str = COMMUNITY_ENGINE,
+                       resolution: float = COMMUNITY_RESOLUTION, seed: int = COMMUNITY_SEED) -> dict:
+    """
+    Community partition of G, computed at most once per graph in a run.
+    
+    A 'modularity_class' already stored on every node (by
+    enrich_network_attributes) is returned as is; otherwise partitions are
+    memoized by graph fingerprint and engine settings, so every consumer of
+    the same network sees the same partition.
+    """
+    if G.number_of_nodes() == 0:
+        return {}
+    
+    stored = dict(G.nodes(data='modularity_class'))
+    if None not in stored.values():
+        return stored
+    
+    key = (graph_fingerprint(G), describe_community_engine(engine, resolution, seed))
+    if key not in community_cache:
+        community_cache[key] = partition_communities(G, engine, resolution, seed)
+    
+    return dict(community_cache[key])
+
+
+def partition_communities(G: nx.Graph, engine: str = COMMUNITY_ENGINE,
+                          resolution: float = COMMUNITY_RESOLUTION, seed: int = COMMUNITY_SEED) -> dict:
+    """
+    Detect communities with the selected modularity engine (uncached).
+    
+    Engines:
+        louvain: Louvain method (Blondel et al., 2008), networkx implementation
+        leiden: Leiden method (Traag et al., 2019) via leidenalg; its refinement
+                step guarantees connected communities. Falls back to Louvain.
+        greedy: Clauset-Newman-Moore greedy modularity optimization
+    
+    Community IDs are numbered by decreasing size.
+    """
+    if G.number_of_nodes() == 0:
         return {}
     
     try:
-        communities = community.greedy_modularity_communities(G, weight='weight')
+        if engine == 'greedy':
+            communities = community.greedy_modularity_communities(G, weight='weight', resolution=resolution)
+        elif engine == 'leiden' and LEIDEN_AVAILABLE:
+            communities = leiden_communities(G, resolution, seed)
+        else:
+            communities = community.louvain_communities(G, weight='weight', resolution=resolution, seed=seed)
+        
+        communities = sorted(communities, key=len, reverse=True)
         
         node_community = {}
         for idx, comm in enumerate(communities):
@@ -698,8 +1382,182 @@ def detect_communities(G: nx.Graph) -> dict:
         return {node: 0 for node in G.nodes()}
 
 
-def enrich_network_attributes(G: nx.Graph) -> nx.Graph:
-    """Add pre-calculated attributes for Gephi visualization."""
+def leiden_communities(G: nx.Graph, resolution: float = COMMUNITY_RESOLUTION,
+                       seed: int = COMMUNITY_SEED) -> list:
+    """Leiden partition (modularity with resolution) of a networkx graph via igraph."""
+    nodes = list(G)
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = list(G.edges(data='weight', default=1.0))
+    
+    graph = ig.Graph(n=len(nodes), edges=[(index[u], index[v]) for u, v, _ in edges])
+    partition = leidenalg.find_partition(
+        graph, leidenalg.RBConfigurationVertexPartition,
+        weights=[w for _, _, w in edges], resolution_parameter=resolution, seed=seed
+    )
+    
+    return [{nodes[i] for i in members} for members in partition]
+
+
+def describe_community_engine(engine: str = COMMUNITY_ENGINE, resolution: float = COMMUNITY_RESOLUTION,
+                              seed: int = COMMUNITY_SEED) -> str:
+    """Label for the engine actually used, e.g. 'louvain (resolution=1.0, seed=42)'."""
+    if engine == 'leiden' and not LEIDEN_AVAILABLE:
+        engine = 'louvain'
+    if engine == 'greedy':
+        return f"greedy (resolution={resolution})"
+    return f"{engine} (resolution={resolution}, seed={seed})"
+
+
+def partition_modularity(G: nx.Graph, node_community: dict) -> float:
+    """Modularity of a node -> community ID mapping."""
+    comm_sets = defaultdict(set)
+    for node, comm_id in node_community.items():
+        comm_sets[comm_id].add(node)
+    return community.modularity(G, comm_sets.values())
+
+
+def compare_community_engines(networks: dict, output_dir: str, resolution: float = COMMUNITY_RESOLUTION,
+                              seed: int = COMMUNITY_SEED) -> pd.DataFrame:
+    """
+    Run every available community engine on each network and export
+    runtime, community count and modularity to community_engines.csv.
+    """
+    print("\n  Comparing community detection engines...")
+    
+    engines = [e for e in COMMUNITY_ENGINES if e != 'leiden' or LEIDEN_AVAILABLE]
+    rows = []
+    
+    for name, G in networks.items():
+        if G is None or G.number_of_nodes() == 0:
+            continue
+        
+        for engine in engines:
+            start = time.perf_counter()
+            communities = partition_communities(G, engine, resolution, seed)
+            runtime = time.perf_counter() - start
+            
+            try:
+                modularity = round(partition_modularity(G, communities), 4)
+            except Exception:
+                modularity = 'N/A'
+            
+            rows.append({
+                'Network': name,
+                'Engine': describe_community_engine(engine, resolution, seed),
+                'Communities': len(set(communities.values())),
+                'Modularity': modularity,
+                'Runtime_s': round(runtime, 3)
+            })
+    
+    engines_df = pd.DataFrame(rows)
+    if engines_df.empty:
+        return engines_df
+    
+    print(engines_df.to_string(index=False))
+    
+    output_path = os.path.join(output_dir, 'community_engines.csv')
+    engines_df.to_csv(output_path, index=False)
+    print(f"\n  ✓ Community engine comparison exported to: {output_path}")
+    
+    return engines_df
+
+
+worker_graph = None
+
+
+def init_centrality_worker(G: nx.Graph):
+    """Receive the graph once per worker process instead of once per task."""
+    global worker_graph
+    worker_graph = G
+
+
+def betweenness_partial(task: tuple) -> list:
+    """
+    Unnormalized betweenness contributions of a chunk of source nodes;
+    runs inside a worker process.
+    
+    Returns values in graph node order so partial results add up as arrays.
+    """
+    sources, weight = task
+    G = worker_graph
+    partial = nx.betweenness_centrality_subset(G, sources, list(G), normalized=False, weight=weight)
+    return [partial[node] for node in G]
+
+
+def betweenness_from_sources(G: nx.Graph, sources: list, weight: str = None,
+                             workers: int = CENTRALITY_WORKERS) -> dict:
+    """
+    Normalized betweenness accumulated from the given source nodes.
+    
+    Sources are split across worker processes (Brandes' accumulation is
+    independent per source) and the partial dependency scores summed. With
+    fewer sources than nodes the sum is scaled by n / len(sources), the
+    pivot-sampling estimator of Brandes & Pich (2007).
+    """
+    n_nodes = G.number_of_nodes()
+    totals = np.zeros(n_nodes)
+    
+    if workers > 1 and len(sources) > 1:
+        n_chunks = min(len(sources), workers * 4)
+        tasks = [(sources[i::n_chunks], weight) for i in range(n_chunks)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_centrality_worker,
+                                 initargs=(G,)) as executor:
+            for partial in executor.map(betweenness_partial, tasks):
+                totals += partial
+    else:
+        init_centrality_worker(G)
+        totals += betweenness_partial((sources, weight))
+    
+    if n_nodes <= 2:
+        return dict.fromkeys(G, 0.0)
+    
+    # betweenness_centrality_subset halves undirected scores; undo before normalizing
+    scale = (1.0 if G.is_directed() else 2.0) / ((n_nodes - 1) * (n_nodes - 2))
+    scale *= n_nodes / len(sources)
+    
+    return dict(zip(G, (totals * scale).tolist()))
+
+
+def compute_betweenness(G: nx.Graph, weight: str = None, mode: str = BETWEENNESS_MODE,
+                        k: int = BETWEENNESS_SAMPLES, seed: int = BETWEENNESS_SEED,
+                        max_exact_nodes: int = BETWEENNESS_EXACT_MAX_NODES,
+                        workers: int = CENTRALITY_WORKERS) -> tuple:
+    """
+    Betweenness centrality, exact or estimated from k sampled pivot nodes.
+    
+    Exact betweenness is O(VE). In 'auto' mode networks larger than
+    max_exact_nodes use k pivots with a fixed seed, which keeps the estimate
+    reproducible between runs. Networks with at least
+    PARALLEL_CENTRALITY_MIN_NODES nodes are spread over worker processes.
+    
+    Returns:
+        (betweenness dict, description of the mode used)
+    """
+    n_nodes = G.number_of_nodes()
+    approximate = mode == 'approximate' or (mode == 'auto' and n_nodes > max_exact_nodes)
+    if n_nodes < PARALLEL_CENTRALITY_MIN_NODES:
+        workers = 1
+    
+    if approximate and k < n_nodes:
+        pivots = random.Random(seed).sample(list(G), k)
+        betweenness = betweenness_from_sources(G, pivots, weight, workers)
+        return betweenness, f"approximate (k={k}, seed={seed})"
+    
+    if workers > 1:
+        return betweenness_from_sources(G, list(G), weight, workers), f"exact ({workers} workers)"
+    
+    return nx.betweenness_centrality(G, weight=weight), "exact"
+
+
+def enrich_network_attributes(G: nx.Graph, betweenness_options: dict = None,
+                              community_options: dict = None) -> nx.Graph:
+    """
+    Add pre-calculated attributes for Gephi visualization.
+    
+    betweenness_options are passed to compute_betweenness (mode, k, seed,
+    max_exact_nodes, workers) and community_options to detect_communities
+    (engine, resolution, seed).
+    """
     if G.number_of_nodes() == 0:
         return G
     
@@ -708,8 +1566,12 @@ def enrich_network_attributes(G: nx.Graph) -> nx.Graph:
     G_enriched = G.copy()
     
     # Community detection
-    communities = detect_communities(G_enriched)
+    start = time.perf_counter()
+    communities = detect_communities(G_enriched, **(community_options or {}))
+    community_runtime = time.perf_counter() - start
     nx.set_node_attributes(G_enriched, communities, 'modularity_class')
+    G_enriched.graph['community_engine'] = describe_community_engine(**(community_options or {}))
+    print(f"    Communities: {G_enriched.graph['community_engine']} in {community_runtime:.2f}s")
     
     # Degree
     degrees = dict(G_enriched.degree())
@@ -721,8 +1583,11 @@ def enrich_network_attributes(G: nx.Graph) -> nx.Graph:
     
     # Betweenness centrality
     try:
-        betweenness = nx.betweenness_centrality(G_enriched, weight='weight')
+        betweenness, betweenness_mode = compute_betweenness(G_enriched, weight='weight',
+                                                            **(betweenness_options or {}))
         nx.set_node_attributes(G_enriched, betweenness, 'betweenness')
+        G_enriched.graph['betweenness_mode'] = betweenness_mode
+        print(f"    Betweenness: {betweenness_mode}")
     except:
         pass
     
@@ -735,10 +1600,7 @@ def enrich_network_attributes(G: nx.Graph) -> nx.Graph:
     
     # Calculate modularity score
     try:
-        comm_sets = defaultdict(set)
-        for node, comm_id in communities.items():
-            comm_sets[comm_id].add(node)
-        modularity = nx.algorithms.community.modularity(G_enriched, comm_sets.values())
+        modularity = partition_modularity(G_enriched, communities)
         G_enriched.graph['modularity'] = modularity
         print(f"    Modularity: {modularity:.3f}")
     except Exception as e:
@@ -761,17 +1623,23 @@ def define_time_periods(df: pd.DataFrame, n_periods: int = N_TIME_PERIODS) -> li
     """
     years = pd.to_numeric(df['PY'], errors='coerce').dropna().astype(int)
     
-    if len(years) == 0:
+    # Count documents per year
+    return define_time_periods_from_counts(years.value_counts().sort_index(), n_periods)
+
+
+def define_time_periods_from_counts(year_counts: pd.Series, n_periods: int = N_TIME_PERIODS) -> list:
+    """Define volume-based time periods from a year-indexed series of document counts."""
+    year_counts = year_counts[year_counts > 0].sort_index()
+    
+    if len(year_counts) == 0:
         return []
     
-    # Count documents per year
-    year_counts = years.value_counts().sort_index()
-    min_year = int(years.min())
-    max_year = int(years.max())
+    min_year = int(year_counts.index.min())
+    max_year = int(year_counts.index.max())
     
     # Try to find meaningful breakpoints based on literature growth
     # For Digital Entrepreneurship: typically pre-2018, 2018-2021, 2022+
-    total_docs = len(years)
+    total_docs = int(year_counts.sum())
     
     # Find year where we have at least 15% of documents (early period ends)
     cumsum = year_counts.cumsum()
@@ -810,57 +1678,135 @@ def define_time_periods(df: pd.DataFrame, n_periods: int = N_TIME_PERIODS) -> li
     
     print(f"\n  Time periods defined (volume-based):")
     for p in periods:
-        docs_in_period = len(years[(years >= p['start']) & (years <= p['end'])])
+        docs_in_period = int(year_counts[(year_counts.index >= p['start']) & (year_counts.index <= p['end'])].sum())
         print(f"    {p['name']}: {p['start']}-{p['end']} ({docs_in_period} docs)")
     
     return periods
 
 
-def build_period_keyword_network(df: pd.DataFrame, start_year: int, end_year: int) -> tuple:
-    """Build keyword network for a specific time period."""
-    # Filter by year
-    df_period = df.copy()
-    df_period['year_num'] = pd.to_numeric(df_period['PY'], errors='coerce')
-    df_period = df_period[(df_period['year_num'] >= start_year) & (df_period['year_num'] <= end_year)]
-    
-    if len(df_period) == 0:
-        return nx.Graph(), Counter()
+class PeriodKeywordIndex:
+    """
+    Keyword counts per year and records sorted by year, built once per corpus.
     
-    all_keywords = Counter()
-    record_keywords = []
+    Any year range then maps to a contiguous slice: keyword frequencies are a
+    sum over the range's rows of the year x keyword count matrix and the
+    co-occurrence input is a row slice of the year-sorted record x keyword
+    matrix. Periods and sliding windows cost no re-parsing.
+    """
     
-    for _, row in df_period.iterrows():
-        keywords = set()
-        keywords.update(parse_keywords(row.get('DE', '')))
-        keywords.update(parse_keywords(row.get('ID', '')))
+    def __init__(self, corpus: ParsedCorpus):
+        self.keywords = corpus.keywords
         
-        if keywords:
-            record_keywords.append(keywords)
-            all_keywords.update(keywords)
+        order = np.argsort(corpus.years, kind='stable')
+        self.record_years = corpus.years[order]
+        self.record_matrix = self.keywords.matrix()[order]
+        
+        # Year x keyword counts: one row per distinct year
+        self.years, year_rows = np.unique(self.record_years, return_inverse=True)
+        self.year_matrix = sparse.csr_matrix(
+            (np.ones(len(order), dtype=np.int64), (year_rows, np.arange(len(order)))),
+            shape=(len(self.years), len(order))
+        ) @ self.record_matrix
+    
+    def record_range(self, start_year: int, end_year: int) -> tuple:
+        """[lo, hi) positions of the records published in start_year..end_year."""
+        lo = int(np.searchsorted(self.record_years, start_year, side='left'))
+        hi = int(np.searchsorted(self.record_years, end_year, side='right'))
+        return lo, hi
+    
+    def keyword_counts(self, start_year: int, end_year: int) -> np.ndarray:
+        """Records per keyword ID in start_year..end_year."""
+        lo = int(np.searchsorted(self.years, start_year, side='left'))
+        hi = int(np.searchsorted(self.years, end_year, side='right'))
+        return np.asarray(self.year_matrix[lo:hi].sum(axis=0)).ravel()
+    
+    def period_matrix(self, start_year: int, end_year: int) -> 'sparse.csr_matrix':
+        """Record x keyword matrix of the records in start_year..end_year."""
+        lo, hi = self.record_range(start_year, end_year)
+        return self.record_matrix[lo:hi]
+
+
+def build_period_keyword_network(df: pd.DataFrame, start_year: int, end_year: int,
+                                 corpus: ParsedCorpus = None,
+                                 index: PeriodKeywordIndex = None) -> tuple:
+    """Build keyword network for a specific time period."""
+    if index is None:
+        index = PeriodKeywordIndex(corpus if corpus is not None else ParsedCorpus(df))
+    
+    lo, hi = index.record_range(start_year, end_year)
+    if lo == hi:
+        return nx.Graph(), Counter()
     
-    # Get top keywords for this period
-    top_n = min(30, len(all_keywords))
-    top_keywords = {kw for kw, _ in all_keywords.most_common(top_n)}
+    all_keywords, top_keywords, top_ids = top_period_keywords(
+        index.keywords, index.keyword_counts(start_year, end_year)
+    )
     
     # Build co-occurrence
-    cooccurrence = Counter()
-    for keywords in record_keywords:
-        filtered = keywords & top_keywords
-        for pair in combinations(sorted(filtered), 2):
-            cooccurrence[pair] += 1
+    rows, cols, weights = keyword_cooccurrence_matrix(index.period_matrix(start_year, end_year), top_ids, 1)
+    G = keyword_graph_from_coo(top_keywords, rows, cols, weights)
     
-    G = nx.Graph()
-    for kw in top_keywords:
-        G.add_node(kw, frequency=all_keywords[kw])
+    return G, all_keywords
+
+
+def top_period_keywords(keywords: InternedField, counts: np.ndarray, top_n: int = 30) -> tuple:
+    """
+    Keyword frequencies of a period and its top keywords.
     
-    for (kw1, kw2), weight in cooccurrence.items():
-        if weight >= 1:
-            G.add_edge(kw1, kw2, weight=weight)
+    Returns:
+        (Counter of all keywords, ranked top (keyword, count) pairs, their token IDs)
+    """
+    all_keywords = Counter({keywords.names[i]: int(counts[i]) for i in np.flatnonzero(counts)})
+    top_keywords = rank_keywords(all_keywords, min(top_n, len(all_keywords)))
+    top_ids = [keywords.index[kw] for kw, _ in top_keywords]
+    return all_keywords, top_keywords, top_ids
+
+
+class SlidingKeywordWindow:
+    """
+    Keyword co-occurrence of a moving year window, updated incrementally.
     
-    return G, all_keywords
+    Keeps the window's full keyword x keyword co-occurrence matrix (the
+    diagonal holds keyword frequencies). Moving the window adds the
+    per-year matrices of entering years and subtracts those of leaving
+    years instead of recounting the overlap.
+    """
+    
+    def __init__(self, index: PeriodKeywordIndex):
+        self.index = index
+        n_tokens = index.keywords.n_tokens
+        self.cooccurrence = sparse.csr_matrix((n_tokens, n_tokens), dtype=np.int64)
+        self.years = set()
+    
+    def year_cooccurrence(self, year: int) -> 'sparse.csr_matrix':
+        X = (self.index.period_matrix(year, year) > 0).astype(np.int64)
+        return (X.T @ X).tocsr()
+    
+    def move_to(self, start_year: int, end_year: int):
+        """Shift the window to start_year..end_year."""
+        target = set(range(start_year, end_year + 1))
+        for year in sorted(self.years - target):
+            self.cooccurrence = self.cooccurrence - self.year_cooccurrence(year)
+        for year in sorted(target - self.years):
+            self.cooccurrence = self.cooccurrence + self.year_cooccurrence(year)
+        self.cooccurrence.eliminate_zeros()
+        self.years = target
+    
+    def network(self) -> tuple:
+        """Keyword network of the current window, as build_period_keyword_network."""
+        all_keywords, top_keywords, top_ids = top_period_keywords(
+            self.index.keywords, self.cooccurrence.diagonal()
+        )
+        if not top_keywords:
+            return nx.Graph(), Counter()
+        
+        rows, cols, weights = cooccurrence_coo(self.cooccurrence[top_ids][:, top_ids], 1)
+        G = keyword_graph_from_coo(top_keywords, rows, cols, weights)
+        
+        return G, all_keywords
 
 
-def analyze_temporal_evolution(df: pd.DataFrame, output_dir: str) -> pd.DataFrame:
+def analyze_temporal_evolution(df: pd.DataFrame, output_dir: str,
+                               corpus: ParsedCorpus = None, community_options: dict = None) -> pd.DataFrame:
     """
     Analyze temporal evolution of themes for Sankey diagram.
     Returns DataFrame for Sankey visualization.
@@ -875,14 +1821,51 @@ def analyze_temporal_evolution(df: pd.DataFrame, output_dir: str) -> pd.DataFram
         print("  Insufficient time span for temporal analysis")
         return pd.DataFrame()
     
-    # Build networks and detect communities for each period
+    if corpus is None:
+        corpus = ParsedCorpus(df)
+    index = PeriodKeywordIndex(corpus)
+    
+    period_networks = [
+        (period,) + build_period_keyword_network(df, period['start'], period['end'], index=index)
+        for period in periods
+    ]
+    
+    return temporal_evolution_from_networks(period_networks, output_dir, community_options)
+
+
+def temporal_evolution_from_networks(period_networks: list, output_dir: str,
+                                     community_options: dict = None) -> pd.DataFrame:
+    """
+    Detect clusters per period and link them across adjacent periods.
+    
+    Args:
+        period_networks: (period, keyword graph, keyword Counter) per period, in order
+        output_dir: Directory for temporal_evolution_sankey.csv
+    """
+    period_data = cluster_period_networks(period_networks, community_options)
+    
+    # Generate Sankey data
+    sankey_rows = []
+    for i in range(len(period_data) - 1):
+        sankey_rows.extend(row for _, _, row in link_period_clusters(period_data[i], period_data[i + 1]))
+    
+    sankey_df = pd.DataFrame(sankey_rows)
+    
+    if not sankey_df.empty:
+        sankey_path = os.path.join(output_dir, 'temporal_evolution_sankey.csv')
+        sankey_df.to_csv(sankey_path, index=False)
+        print(f"\n  ✓ Sankey data exported to: {sankey_path}")
+    
+    return sankey_df
+
+
+def cluster_period_networks(period_networks: list, community_options: dict = None) -> list:
+    """Detect communities in each non-empty period network and rank their keywords."""
     period_data = []
     
-    for period in periods:
-        G, keywords = build_period_keyword_network(df, period['start'], period['end'])
-        
+    for period, G, keywords in period_networks:
         if G.number_of_nodes() > 0:
-            communities = detect_communities(G)
+            communities = detect_communities(G, **(community_options or {}))
             
             # Group keywords by community
             cluster_keywords = defaultdict(list)
@@ -891,7 +1874,7 @@ def analyze_temporal_evolution(df: pd.DataFrame, output_dir: str) -> pd.DataFram
             
             # Sort keywords within each cluster by frequency
             for comm_id in cluster_keywords:
-                cluster_keywords[comm_id].sort(key=lambda x: x[1], reverse=True)
+                cluster_keywords[comm_id].sort(key=lambda x: (-x[1], x[0]))
             
             period_data.append({
                 'period': period,
@@ -903,61 +1886,224 @@ def analyze_temporal_evolution(df: pd.DataFrame, output_dir: str) -> pd.DataFram
             
             print(f"\n  {period['name']}: {G.number_of_nodes()} keywords, {len(set(communities.values()))} clusters")
     
-    # Generate Sankey data
-    sankey_rows = []
+    return period_data
+
+
+def link_period_clusters(p1: dict, p2: dict) -> list:
+    """
+    Sankey links between the clusters of two consecutive periods.
     
-    for i in range(len(period_data) - 1):
-        p1 = period_data[i]
-        p2 = period_data[i + 1]
+    Clusters are matched on their top 15 keywords through an inverted
+    keyword -> cluster index of p2, so only cluster pairs sharing at least
+    one keyword are scored; Jaccard and overlap coefficients follow from
+    the hit counts and the set sizes.
+    
+    Returns:
+        (source cluster ID, target cluster ID, Sankey row) per link
+    """
+    links = []
+    transition = f"{p1['period']['name']}→{p2['period']['name']}"
+    
+    # Inverted index: keyword -> clusters of p2 having it among their top 15
+    target_order = {c2_id: pos for pos, c2_id in enumerate(p2['cluster_keywords'])}
+    target_sizes = {}
+    keyword_clusters = defaultdict(list)
+    for c2_id, c2_keywords in p2['cluster_keywords'].items():
+        c2_top = list(dict.fromkeys(kw for kw, _ in c2_keywords[:15]))
+        target_sizes[c2_id] = len(c2_top)
+        for kw in c2_top:
+            keyword_clusters[kw].append(c2_id)
+    
+    for c1_id, c1_keywords in p1['cluster_keywords'].items():
+        c1_top = list(dict.fromkeys(kw for kw, _ in c1_keywords[:15]))  # Top 15 keywords for better matching
+        c1_name = c1_keywords[0][0] if c1_keywords else f"Cluster_{c1_id}"
         
-        transition = f"{p1['period']['name']}→{p2['period']['name']}"
+        shared = defaultdict(list)
+        for kw in c1_top:
+            for c2_id in keyword_clusters.get(kw, ()):
+                shared[c2_id].append(kw)
         
-        # For each cluster in p1, find ALL clusters in p2 with meaningful overlap
-        for c1_id, c1_keywords in p1['cluster_keywords'].items():
-            c1_kw_set = set(kw for kw, _ in c1_keywords[:15])  # Top 15 keywords for better matching
-            c1_name = c1_keywords[0][0] if c1_keywords else f"Cluster_{c1_id}"
+        for c2_id in sorted(shared, key=target_order.get):
+            c2_keywords = p2['cluster_keywords'][c2_id]
+            c2_name = c2_keywords[0][0] if c2_keywords else f"Cluster_{c2_id}"
             
-            # Find all clusters in p2 with meaningful overlap
-            for c2_id, c2_keywords in p2['cluster_keywords'].items():
-                c2_kw_set = set(kw for kw, _ in c2_keywords[:15])
-                c2_name = c2_keywords[0][0] if c2_keywords else f"Cluster_{c2_id}"
-                
-                if len(c1_kw_set | c2_kw_set) > 0:
-                    # Calculate multiple similarity metrics
-                    intersection = c1_kw_set & c2_kw_set
-                    jaccard = len(intersection) / len(c1_kw_set | c2_kw_set)
-                    overlap_coef = len(intersection) / min(len(c1_kw_set), len(c2_kw_set)) if min(len(c1_kw_set), len(c2_kw_set)) > 0 else 0
-                    
-                    # Use a lower threshold (0.05) and also consider overlap coefficient
-                    if jaccard > 0.05 or overlap_coef > 0.15:
-                        sankey_rows.append({
-                            'Source': f"{p1['period']['name']}_{c1_name}",
-                            'Target': f"{p2['period']['name']}_{c2_name}",
-                            'Value': round(max(jaccard, overlap_coef * 0.5), 3),
-                            'Jaccard': round(jaccard, 3),
-                            'Overlap_Coef': round(overlap_coef, 3),
-                            'Shared_Keywords': len(intersection),
-                            'Period_Transition': transition,
-                            'Source_Keywords': ", ".join([kw for kw, _ in c1_keywords[:5]]),
-                            'Target_Keywords': ", ".join([kw for kw, _ in c2_keywords[:5]]),
-                            'Common_Keywords': ", ".join(list(intersection)[:5])
-                        })
+            # Calculate multiple similarity metrics
+            intersection = shared[c2_id]
+            jaccard = len(intersection) / (len(c1_top) + target_sizes[c2_id] - len(intersection))
+            overlap_coef = len(intersection) / min(len(c1_top), target_sizes[c2_id])
+            
+            # Use a lower threshold (0.05) and also consider overlap coefficient
+            if jaccard > 0.05 or overlap_coef > 0.15:
+                links.append((c1_id, c2_id, {
+                    'Source': f"{p1['period']['name']}_{c1_name}",
+                    'Target': f"{p2['period']['name']}_{c2_name}",
+                    'Value': round(max(jaccard, overlap_coef * 0.5), 3),
+                    'Jaccard': round(jaccard, 3),
+                    'Overlap_Coef': round(overlap_coef, 3),
+                    'Shared_Keywords': len(intersection),
+                    'Period_Transition': transition,
+                    'Source_Keywords': ", ".join([kw for kw, _ in c1_keywords[:5]]),
+                    'Target_Keywords': ", ".join([kw for kw, _ in c2_keywords[:5]]),
+                    'Common_Keywords': ", ".join(intersection[:5])
+                }))
+    
+    return links
+
+
+def define_sliding_windows(year_counts: pd.Series, window_size: int = WINDOW_SIZE,
+                           stride: int = WINDOW_STRIDE, window_volume: int = None) -> list:
+    """
+    Define overlapping year windows for sliding-window thematic evolution.
     
-    sankey_df = pd.DataFrame(sankey_rows)
+    Windows start every `stride` years from the first publication year and
+    span `window_size` years or, with window_volume, as many years as needed
+    to hold at least that many documents (equal-volume windows). The last
+    window always ends at the last publication year.
+    """
+    year_counts = year_counts[year_counts > 0].sort_index()
+    if len(year_counts) == 0:
+        return []
     
-    if not sankey_df.empty:
-        sankey_path = os.path.join(output_dir, 'temporal_evolution_sankey.csv')
-        sankey_df.to_csv(sankey_path, index=False)
-        print(f"\n  ✓ Sankey data exported to: {sankey_path}")
+    min_year = int(year_counts.index.min())
+    max_year = int(year_counts.index.max())
+    counts = {int(y): int(c) for y, c in year_counts.items()}
+    
+    window_size = max(1, window_size)
+    stride = max(1, stride)
+    
+    windows = []
+    start = min_year
+    while True:
+        if window_volume:
+            end, docs = start, counts.get(start, 0)
+            while docs < window_volume and end < max_year:
+                end += 1
+                docs += counts.get(end, 0)
+        else:
+            end = min(start + window_size - 1, max_year)
+        
+        docs = sum(counts.get(y, 0) for y in range(start, end + 1))
+        windows.append({'name': f"{start}-{end}", 'start': start, 'end': end,
+                        'index': len(windows), 'docs': docs})
+        
+        if end >= max_year:
+            break
+        start += stride
     
-    return sankey_df
+    mode = f"{window_volume} docs" if window_volume else f"{window_size} years"
+    print(f"\n  Sliding windows defined ({mode}, stride {stride}): {len(windows)}")
+    for window in windows:
+        print(f"    {window['name']} ({window['docs']} docs)")
+    
+    return windows
+
+
+def analyze_sliding_evolution(df: pd.DataFrame, output_dir: str, corpus: ParsedCorpus = None,
+                              window_size: int = WINDOW_SIZE, stride: int = WINDOW_STRIDE,
+                              window_volume: int = None, community_options: dict = None) -> pd.DataFrame:
+    """
+    Sliding-window thematic evolution with cluster lineage.
+    
+    Builds one keyword network and partition per window, moving a single
+    incrementally updated co-occurrence matrix across the years, links the
+    clusters of consecutive windows as in the period Sankey, and follows
+    each cluster's lineage through all windows. A cluster continues the
+    lineage of its strongest incoming link; clusters without one start a
+    new lineage. Exports temporal_evolution_sliding.csv.
+    """
+    print("\n" + "=" * 70)
+    print("SLIDING-WINDOW THEMATIC EVOLUTION")
+    print("=" * 70)
+    
+    if corpus is None:
+        corpus = ParsedCorpus(df)
+    
+    years = corpus.years[corpus.years > 0]
+    windows = define_sliding_windows(pd.Series(years).value_counts(), window_size, stride, window_volume)
+    
+    if len(windows) < 2:
+        print("  Insufficient time span for temporal analysis")
+        return pd.DataFrame()
+    
+    sliding = SlidingKeywordWindow(PeriodKeywordIndex(corpus))
+    window_networks = []
+    for window in windows:
+        sliding.move_to(window['start'], window['end'])
+        window_networks.append((window,) + sliding.network())
+    
+    window_data = cluster_period_networks(window_networks, community_options)
+    
+    # Link consecutive windows and carry lineages forward
+    lineage = {}
+    lineage_names = []
+    
+    def start_lineage(data, comm_id):
+        lineage_names.append(data['cluster_keywords'][comm_id][0][0])
+        return len(lineage_names) - 1
+    
+    if window_data:
+        for comm_id in window_data[0]['cluster_keywords']:
+            lineage[(0, comm_id)] = start_lineage(window_data[0], comm_id)
+    
+    rows = []
+    for i in range(len(window_data) - 1):
+        links = link_period_clusters(window_data[i], window_data[i + 1])
+        
+        best_source = {}
+        for c1_id, c2_id, row in links:
+            if c2_id not in best_source or row['Value'] > best_source[c2_id][1]:
+                best_source[c2_id] = (c1_id, row['Value'])
+        
+        for c2_id in window_data[i + 1]['cluster_keywords']:
+            if c2_id in best_source:
+                lineage[(i + 1, c2_id)] = lineage[(i, best_source[c2_id][0])]
+            else:
+                lineage[(i + 1, c2_id)] = start_lineage(window_data[i + 1], c2_id)
+        
+        n_targets = Counter(c1_id for c1_id, _, _ in links)
+        n_sources = Counter(c2_id for _, c2_id, _ in links)
+        
+        for c1_id, c2_id, row in links:
+            source_lineage = lineage[(i, c1_id)]
+            target_lineage = lineage[(i + 1, c2_id)]
+            
+            if n_sources[c2_id] > 1:
+                event = 'merge'
+            elif n_targets[c1_id] > 1:
+                event = 'split'
+            else:
+                event = 'continuation'
+            
+            row.update({
+                'Source_Start': window_data[i]['period']['start'],
+                'Source_End': window_data[i]['period']['end'],
+                'Target_Start': window_data[i + 1]['period']['start'],
+                'Target_End': window_data[i + 1]['period']['end'],
+                'Source_Lineage': f"L{source_lineage}_{lineage_names[source_lineage]}",
+                'Target_Lineage': f"L{target_lineage}_{lineage_names[target_lineage]}",
+                'Same_Lineage': source_lineage == target_lineage,
+                'Event': event
+            })
+            rows.append(row)
+    
+    sliding_df = pd.DataFrame(rows)
+    
+    print(f"\n  Cluster lineages tracked: {len(lineage_names)}")
+    
+    if not sliding_df.empty:
+        output_path = os.path.join(output_dir, 'temporal_evolution_sliding.csv')
+        sliding_df.to_csv(output_path, index=False)
+        print(f"  ✓ Sliding-window Sankey data exported to: {output_path}")
+    
+    return sliding_df
 
 
 # =============================================================================
 # CORE AUTHORS BY CLUSTER
 # =============================================================================
 
-def identify_core_authors(df: pd.DataFrame, keyword_network: nx.Graph, output_dir: str) -> pd.DataFrame:
+def identify_core_authors(df: pd.DataFrame, keyword_network: nx.Graph, output_dir: str,
+                          corpus: ParsedCorpus = None, community_options: dict = None) -> pd.DataFrame:
     """
     Identify core authors for each thematic cluster.
     """
@@ -970,7 +2116,7 @@ def identify_core_authors(df: pd.DataFrame, keyword_network: nx.Graph, output_di
         return pd.DataFrame()
     
     # Get communities from keyword network
-    communities = detect_communities(keyword_network)
+    communities = detect_communities(keyword_network, **(community_options or {}))
     
     # Group keywords by cluster
     cluster_keywords = defaultdict(set)
@@ -988,26 +2134,22 @@ def identify_core_authors(df: pd.DataFrame, keyword_network: nx.Graph, output_di
     max_year = int(years.max()) if len(years) > 0 else 2025
     recent_years = [max_year, max_year - 1]
     
-    keyword_freq_recent = Counter()
-    keyword_freq_historical = Counter()
+    if corpus is None:
+        corpus = ParsedCorpus(df)
     
-    for _, row in df.iterrows():
-        authors = parse_authors(row.get('AU', ''))
-        paper_keywords = set()
-        paper_keywords.update(parse_keywords(row.get('DE', '')))
-        paper_keywords.update(parse_keywords(row.get('ID', '')))
-        
-        try:
-            year = int(float(row.get('PY', 0)))
-        except:
-            year = 0
-        
-        # Count keyword frequencies by period
-        for kw in paper_keywords:
-            if year in recent_years:
-                keyword_freq_recent[kw] += 1
-            else:
-                keyword_freq_historical[kw] += 1
+    # Count keyword frequencies by period
+    keywords = corpus.keywords
+    is_recent = np.isin(corpus.years, recent_years)[keywords.value_records()]
+    recent_counts = np.bincount(keywords.values[is_recent], minlength=keywords.n_tokens)
+    historical_counts = np.bincount(keywords.values[~is_recent], minlength=keywords.n_tokens)
+    keyword_freq_recent = {kw: int(c) for kw, c in zip(keywords.names, recent_counts) if c}
+    keyword_freq_historical = {kw: int(c) for kw, c in zip(keywords.names, historical_counts) if c}
+    
+    titles = df['TI'].tolist() if 'TI' in df.columns else [''] * corpus.n_records
+    
+    for i in range(corpus.n_records):
+        authors = corpus.authors.tokens(i)
+        paper_keywords = set(keywords.tokens(i))
         
         # Match paper to clusters
         for cluster_id, cluster_kws in cluster_keywords.items():
@@ -1016,7 +2158,7 @@ def identify_core_authors(df: pd.DataFrame, keyword_network: nx.Graph, output_di
                 for author in authors:
                     if author:
                         cluster_authors[cluster_id][author] += len(overlap)
-                        author_papers_in_cluster[cluster_id][author].append(row.get('TI', ''))
+                        author_papers_in_cluster[cluster_id][author].append(titles[i])
     
     # Build results
     results = []
@@ -1080,12 +2222,14 @@ def identify_core_authors(df: pd.DataFrame, keyword_network: nx.Graph, output_di
 # BURST DETECTION
 # =============================================================================
 
-def detect_keyword_bursts(df: pd.DataFrame, output_dir: str, n_recent_years: int = 2) -> pd.DataFrame:
+def detect_keyword_bursts(df: pd.DataFrame, output_dir: str, n_recent_years: int = 2,
+                          corpus: ParsedCorpus = None, engine: str = BURST_ENGINE) -> pd.DataFrame:
     """
     Detect keywords with frequency bursts using Z-score method.
     
     A keyword is in "burst" if its recent frequency is significantly higher
-    than its historical average (z-score > threshold).
+    than its historical average (z-score > threshold). The kleinberg engine
+    also reports each keyword's strongest Kleinberg burst.
     """
     print("\n" + "=" * 70)
     print("BURST DETECTION")
@@ -1099,75 +2243,239 @@ def detect_keyword_bursts(df: pd.DataFrame, output_dir: str, n_recent_years: int
     
     max_year = int(years.max())
     min_year = int(years.min())
-    recent_years = set(range(max_year - n_recent_years + 1, max_year + 1))
     
-    print(f"  Analyzing bursts for years: {list(recent_years)}")
-    print(f"  Historical baseline: {min_year}-{max_year - n_recent_years}")
+    if corpus is None:
+        corpus = ParsedCorpus(df)
     
     # Count keyword frequencies by year
-    keyword_by_year = defaultdict(lambda: defaultdict(int))
+    keywords, counts = corpus_keyword_year_matrix(corpus, min_year, max_year)
     
-    for _, row in df.iterrows():
-        try:
-            year = int(float(row.get('PY', 0)))
-        except:
-            continue
-        
-        keywords = set()
-        keywords.update(parse_keywords(row.get('DE', '')))
-        keywords.update(parse_keywords(row.get('ID', '')))
-        
-        for kw in keywords:
-            keyword_by_year[kw][year] += 1
+    years_present, n_records = np.unique(corpus.years[corpus.years > 0], return_counts=True)
+    year_totals = dict(zip(years_present.tolist(), n_records.tolist()))
+    
+    return keyword_bursts_from_matrix(keywords, counts, min_year, max_year, output_dir, n_recent_years,
+                                      engine, year_totals)
+
+
+def keyword_bursts_from_counts(keyword_by_year: dict, min_year: int, max_year: int,
+                               output_dir: str, n_recent_years: int = 2, engine: str = BURST_ENGINE,
+                               year_totals: dict = None) -> pd.DataFrame:
+    """
+    Compute and export z-score bursts from per-keyword yearly counts.
     
-    # Calculate z-scores
-    burst_results = []
+    Args:
+        keyword_by_year: keyword -> {year: records with that keyword}
+        min_year, max_year: Publication year range of the whole corpus
+        engine: 'zscore', or 'kleinberg' to add Kleinberg burst columns
+        year_totals: year -> records, the Kleinberg base population
+    """
+    keywords, counts = keyword_year_matrix(keyword_by_year, min_year, max_year)
     
-    for kw, year_counts in keyword_by_year.items():
-        historical_counts = [year_counts.get(y, 0) for y in range(min_year, max_year - n_recent_years + 1)]
-        recent_counts = [year_counts.get(y, 0) for y in recent_years]
-        
-        if len(historical_counts) < 3:  # Need enough historical data
-            continue
-        
-        mean_hist = np.mean(historical_counts)
-        std_hist = np.std(historical_counts)
+    return keyword_bursts_from_matrix(keywords, counts, min_year, max_year, output_dir, n_recent_years,
+                                      engine, year_totals)
+
+
+def keyword_bursts_from_matrix(keywords: list, counts: np.ndarray, min_year: int, max_year: int,
+                               output_dir: str, n_recent_years: int = 2, engine: str = BURST_ENGINE,
+                               year_totals: dict = None) -> pd.DataFrame:
+    """
+    Compute and export bursts from a keyword x year count matrix (see
+    keyword_year_matrix; keywords in alphabetical order keep ties
+    independent of read order).
+    """
+    recent_years = set(range(max_year - n_recent_years + 1, max_year + 1))
+    
+    print(f"  Analyzing bursts for years: {list(recent_years)}")
+    print(f"  Historical baseline: {min_year}-{max_year - n_recent_years}")
+    
+    n_historical = max_year - n_recent_years + 1 - min_year
+    
+    if n_historical < 3:  # Need enough historical data
+        burst_df = pd.DataFrame()
+    else:
+        # Calculate z-scores for all keywords at once
+        historical = counts[:, :n_historical]
+        recent = counts[:, counts.shape[1] - n_recent_years:]
         
-        if std_hist == 0:
-            std_hist = 0.5  # Avoid division by zero
+        mean_hist = historical.mean(axis=1)
+        std_hist = historical.std(axis=1)
+        std_hist[std_hist == 0] = 0.5  # Avoid division by zero
         
-        mean_recent = np.mean(recent_counts)
+        mean_recent = recent.mean(axis=1)
         z_score = (mean_recent - mean_hist) / std_hist
         
-        total_freq = sum(year_counts.values())
-        
-        burst_results.append({
-            'Keyword': kw,
-            'Z_Score': round(z_score, 2),
-            'Recent_Avg_Freq': round(mean_recent, 2),
-            'Historical_Avg_Freq': round(mean_hist, 2),
-            'Total_Frequency': total_freq,
+        burst_df = pd.DataFrame({
+            'Keyword': keywords,
+            'Z_Score': np.round(z_score, 2),
+            'Recent_Avg_Freq': np.round(mean_recent, 2),
+            'Historical_Avg_Freq': np.round(mean_hist, 2),
+            'Total_Frequency': counts.sum(axis=1),
             'Is_Burst': z_score > BURST_ZSCORE_THRESHOLD,
-            'Years_Active': len([y for y, c in year_counts.items() if c > 0])
+            'Years_Active': np.count_nonzero(counts, axis=1)
         })
+        burst_df = burst_df.sort_values('Z_Score', ascending=False)
     
-    burst_df = pd.DataFrame(burst_results)
-    burst_df = burst_df.sort_values('Z_Score', ascending=False)
+    if engine == 'kleinberg' and keywords:
+        burst_df = add_kleinberg_bursts(burst_df, keywords, counts, min_year, year_totals or {})
     
     if not burst_df.empty:
         output_path = os.path.join(output_dir, 'keyword_bursts.csv')
         burst_df.to_csv(output_path, index=False)
         print(f"\n  ✓ Burst analysis exported to: {output_path}")
         
-        # Print top bursts
-        bursting = burst_df[burst_df['Is_Burst'] == True]
-        print(f"\n  Keywords in BURST (z > {BURST_ZSCORE_THRESHOLD}):")
-        for _, row in bursting.head(15).iterrows():
-            print(f"    {row['Keyword'][:30]:30} z={row['Z_Score']:5.2f} (↑ {row['Recent_Avg_Freq']:.1f} vs hist {row['Historical_Avg_Freq']:.1f})")
+        # Print top bursts (z-scores need at least 3 historical years)
+        if 'Is_Burst' in burst_df.columns:
+            bursting = burst_df[burst_df['Is_Burst'] == True]
+            print(f"\n  Keywords in BURST (z > {BURST_ZSCORE_THRESHOLD}):")
+            for _, row in bursting.head(15).iterrows():
+                print(f"    {row['Keyword'][:30]:30} z={row['Z_Score']:5.2f} (↑ {row['Recent_Avg_Freq']:.1f} vs hist {row['Historical_Avg_Freq']:.1f})")
+        
+        if 'Burst_Strength' in burst_df.columns:
+            print(f"\n  Strongest Kleinberg bursts:")
+            for _, row in burst_df[burst_df['Burst_Strength'] > 0].head(15).iterrows():
+                print(f"    {row['Keyword'][:30]:30} {int(row['Burst_Start'])}-{int(row['Burst_End'])} "
+                      f"strength={row['Burst_Strength']:.2f}")
     
     return burst_df
 
 
+def keyword_year_matrix(keyword_by_year: dict, min_year: int, max_year: int) -> tuple:
+    """
+    Dense keyword x year count matrix, keywords in alphabetical order.
+    
+    Returns:
+        (keywords, counts) with counts[i, y - min_year] for keywords[i]
+    """
+    keywords = sorted(keyword_by_year)
+    counts = np.zeros((len(keywords), max_year - min_year + 1), dtype=np.int64)
+    
+    for i, kw in enumerate(keywords):
+        for year, count in keyword_by_year[kw].items():
+            if min_year <= year <= max_year:
+                counts[i, year - min_year] = count
+    
+    return keywords, counts
+
+
+def corpus_keyword_year_matrix(corpus: ParsedCorpus, min_year: int, max_year: int) -> tuple:
+    """
+    keyword_year_matrix computed directly from the interned keyword arrays.
+    
+    Returns the same (keywords, counts): keywords occurring in a dated record
+    within min_year..max_year, in alphabetical order.
+    """
+    keywords = corpus.keywords
+    n_years = max_year - min_year + 1
+    value_years = corpus.years[keywords.value_records()].astype(np.int64)
+    in_range = (value_years >= min_year) & (value_years <= max_year) & (value_years > 0)
+    
+    cells = keywords.values[in_range].astype(np.int64) * n_years + value_years[in_range] - min_year
+    counts = np.bincount(cells, minlength=keywords.n_tokens * n_years).reshape(keywords.n_tokens, n_years)
+    
+    present = np.flatnonzero(counts.sum(axis=1))
+    present = present[np.argsort([keywords.names[i] for i in present.tolist()], kind='stable')]
+    return [keywords.names[i] for i in present.tolist()], counts[present]
+
+
+def kleinberg_bursts(counts: np.ndarray, totals: np.ndarray, s: float = KLEINBERG_S,
+                     gamma: float = KLEINBERG_GAMMA) -> tuple:
+    """
+    Two-state Kleinberg burst detection for every row of a keyword x year matrix.
+    
+    Batched model (Kleinberg, 2003): in year t, counts[k, t] of totals[t]
+    records carry keyword k. The base state emits at the keyword's overall
+    rate p0 and the burst state at s * p0; entering the burst state costs
+    gamma * ln(T). The optimal state sequence is found by a Viterbi pass
+    vectorized across keywords, so the loop runs over years only.
+    
+    Returns:
+        (start, end, strength, n_bursts) arrays per keyword: year indices of
+        the strongest burst (-1 if none), its weight (the likelihood gain of
+        the burst state summed over the burst) and the number of bursts.
+    """
+    n_keywords, n_years = counts.shape
+    r = counts.astype(np.float64)
+    d = np.maximum(totals.astype(np.float64), r.max(axis=0) if n_keywords else 0)
+    
+    p0 = r.sum(axis=1, keepdims=True) / max(d.sum(), 1.0)
+    p1 = np.minimum(p0 * s, 0.9999)
+    
+    def state_cost(p):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cost = -(r * np.log(p) + (d - r) * np.log1p(-p))
+        return np.nan_to_num(cost, nan=0.0, posinf=0.0)
+    
+    cost0 = state_cost(p0)
+    cost1 = state_cost(p1)
+    tau = gamma * np.log(max(n_years, 2))
+    
+    # Viterbi, starting in the base state
+    c0 = cost0[:, 0].copy()
+    c1 = cost1[:, 0] + tau
+    from_burst0 = np.zeros((n_keywords, n_years), dtype=bool)  # base state at t reached from burst state
+    from_burst1 = np.zeros((n_keywords, n_years), dtype=bool)  # burst state at t reached from burst state
+    for t in range(1, n_years):
+        from_burst0[:, t] = c1 < c0
+        from_burst1[:, t] = c1 <= c0 + tau
+        c0, c1 = np.minimum(c0, c1) + cost0[:, t], np.minimum(c0 + tau, c1) + cost1[:, t]
+    
+    states = np.zeros((n_keywords, n_years), dtype=bool)
+    states[:, -1] = c1 < c0
+    for t in range(n_years - 1, 0, -1):
+        states[:, t - 1] = np.where(states[:, t], from_burst1[:, t], from_burst0[:, t])
+    
+    # Strongest run of burst states per keyword
+    gain = cost0 - cost1
+    start = np.full(n_keywords, -1)
+    end = np.full(n_keywords, -1)
+    strength = np.zeros(n_keywords)
+    n_bursts = np.zeros(n_keywords, dtype=np.int64)
+    run_start = np.zeros(n_keywords, dtype=np.int64)
+    run_gain = np.zeros(n_keywords)
+    
+    for t in range(n_years):
+        in_burst = states[:, t]
+        starts = in_burst & (~states[:, t - 1] if t > 0 else True)
+        n_bursts += starts
+        run_start = np.where(starts, t, run_start)
+        run_gain = np.where(starts, 0.0, run_gain) + np.where(in_burst, gain[:, t], 0.0)
+        
+        ends = in_burst & (~states[:, t + 1] if t + 1 < n_years else True)
+        better = ends & (run_gain > strength)
+        start = np.where(better, run_start, start)
+        end = np.where(better, t, end)
+        strength = np.where(better, run_gain, strength)
+    
+    return start, end, strength, n_bursts
+
+
+def add_kleinberg_bursts(burst_df: pd.DataFrame, keywords: list, counts: np.ndarray, min_year: int,
+                         year_totals: dict) -> pd.DataFrame:
+    """Add Burst_Start/End/Strength/Count columns, ordered by burst strength."""
+    totals = np.array([year_totals.get(min_year + t, 0) for t in range(counts.shape[1])], dtype=np.int64)
+    
+    print(f"  Kleinberg burst detection: {len(keywords)} keywords x {counts.shape[1]} years")
+    start, end, strength, n_bursts = kleinberg_bursts(counts, totals)
+    
+    has_burst = start >= 0
+    kleinberg_df = pd.DataFrame({
+        'Keyword': keywords,
+        'Burst_Start': np.where(has_burst, start + min_year, np.nan),
+        'Burst_End': np.where(has_burst, end + min_year, np.nan),
+        'Burst_Strength': np.round(strength, 2),
+        'Burst_Count': n_bursts
+    })
+    kleinberg_df['Burst_Start'] = kleinberg_df['Burst_Start'].astype('Int64')
+    kleinberg_df['Burst_End'] = kleinberg_df['Burst_End'].astype('Int64')
+    
+    if burst_df.empty:
+        burst_df = kleinberg_df
+    else:
+        burst_df = burst_df.merge(kleinberg_df, on='Keyword', how='left')
+    
+    return burst_df.sort_values(['Burst_Strength', 'Keyword'], ascending=[False, True]).reset_index(drop=True)
+
+
 # =============================================================================
 # NETWORK STATISTICS
 # =============================================================================
@@ -1225,6 +2533,9 @@ def calculate_network_statistics(networks: dict, output_dir: str) -> pd.DataFram
         # Average degree
         stats['Avg_Degree'] = round(2 * G.number_of_edges() / G.number_of_nodes(), 2)
         
+        stats['Betweenness_Mode'] = G.graph.get('betweenness_mode', 'N/A')
+        stats['Community_Engine'] = G.graph.get('community_engine', 'N/A')
+        
         stats_rows.append(stats)
         
         print(f"\n  {name}:")
@@ -1242,86 +2553,221 @@ def calculate_network_statistics(networks: dict, output_dir: str) -> pd.DataFram
     return stats_df
 
 
+def sweep_backbone_alphas(G: nx.Graph, alphas: list, output_dir: str,
+                          community_options: dict = None) -> pd.DataFrame:
+    """
+    Summarize the disparity backbone of G at several significance levels.
+    
+    Per-edge alphas are computed once (reusing the 'alpha' attributes left by
+    apply_disparity_filter); each backbone is then a threshold on them.
+    Exports backbone_sweep.csv next to network_statistics.csv.
+    """
+    print("\n  Backbone alpha sweep...")
+    
+    if G is None or G.number_of_edges() == 0:
+        print("    No edges to filter")
+        return pd.DataFrame()
+    
+    if any(edge_alpha is None for _, _, edge_alpha in G.edges(data='alpha')):
+        compute_disparity_alphas(G)
+    
+    rows = []
+    for alpha in sorted(set(alphas)):
+        kept = [(u, v) for u, v, edge_alpha in G.edges(data='alpha') if edge_alpha <= alpha]
+        backbone = G.edge_subgraph(kept)
+        
+        row = {
+            'Alpha': alpha,
+            'Nodes': backbone.number_of_nodes(),
+            'Edges': backbone.number_of_edges(),
+            'Giant_Component_%': 0.0,
+            'Giant_Nodes': 0,
+            'Giant_Edges': 0,
+            'Modularity': 'N/A'
+        }
+        
+        if backbone.number_of_nodes() > 0:
+            giant = backbone.subgraph(max(nx.connected_components(backbone), key=len))
+            row['Giant_Component_%'] = round(100 * giant.number_of_nodes() / backbone.number_of_nodes(), 1)
+            row['Giant_Nodes'] = giant.number_of_nodes()
+            row['Giant_Edges'] = giant.number_of_edges()
+            
+            # Modularity of the giant component, as reported for the exported backbone
+            try:
+                communities = detect_communities(giant, **(community_options or {}))
+                row['Modularity'] = round(partition_modularity(giant, communities), 4)
+            except Exception as e:
+                print(f"    Warning: Could not calculate modularity at alpha={alpha}: {e}")
+        
+        rows.append(row)
+    
+    sweep_df = pd.DataFrame(rows)
+    print(sweep_df.to_string(index=False))
+    
+    output_path = os.path.join(output_dir, 'backbone_sweep.csv')
+    sweep_df.to_csv(output_path, index=False)
+    print(f"\n  ✓ Backbone sweep exported to: {output_path}")
+    
+    return sweep_df
+
+
 # =============================================================================
 # RPYS - REFERENCE PUBLICATION YEAR SPECTROSCOPY
 # =============================================================================
 
-def extract_reference_year(ref_string: str) -> int:
+def analyze_rpys(df: pd.DataFrame, output_dir: str, corpus: ParsedCorpus = None) -> pd.DataFrame:
     """
-    Extract publication year from a WoS reference string.
-    Format: "AUTHOR, YEAR, JOURNAL, VOLUME, PAGE" or similar
+    Reference Publication Year Spectroscopy (RPYS).
+    
+    Analyzes the publication years of cited references to identify
+    historical roots and seminal works in the field.
+    
+    Based on: Marx et al. (2014) - Detecting the historical roots of research fields
     """
-    if pd.isna(ref_string) or not ref_string:
-        return None
+    print("\n" + "=" * 70)
+    print("RPYS - REFERENCE PUBLICATION YEAR SPECTROSCOPY")
+    print("=" * 70)
     
-    # Look for 4-digit year pattern (typically 19xx or 20xx)
-    year_match = re.search(r'\b(19\d{2}|20\d{2})\b', str(ref_string))
-    if year_match:
-        year = int(year_match.group(1))
-        # Validate reasonable range
-        if 1900 <= year <= 2025:
-            return year
-    return None
+    if corpus is None:
+        corpus = ParsedCorpus(df)
+    
+    histogram = ReferenceYearHistogram()
+    histogram.add_corpus(corpus)
+    
+    return rpys_from_histogram(histogram, output_dir)
+
+
+class ReferenceYearHistogram:
+    """
+    Streaming RPYS input: cited references per publication year.
+    
+    Reference years are folded in chunks into a fixed-size integer histogram
+    over RPYS_MIN_YEAR..RPYS_MAX_YEAR. Alongside, citations are counted per
+    canonical cited work (see ReferenceInterner) and bucketed by year, so the
+    most cited works of any year are selected with a bounded heap of
+    `top_k` entries. Batches can be added at any time (see CorpusAggregates).
+    """
+    
+    def __init__(self, top_k: int = RPYS_TOP_REFERENCES,
+                 min_year: int = RPYS_MIN_YEAR, max_year: int = RPYS_MAX_YEAR):
+        self.top_k = top_k
+        self.min_year = min_year
+        self.max_year = max_year
+        self.counts = np.zeros(max_year - min_year + 1, dtype=np.int64)
+        self.work_counts = defaultdict(Counter)  # year -> {work ID: citations}
+        self.work_labels = {}                    # (year, work ID) -> first reference seen (80 chars)
+    
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+    
+    def add(self, years: np.ndarray):
+        """Fold a chunk of reference years (out-of-range years are ignored)."""
+        years = np.asarray(years, dtype=np.int64)
+        slots = years[(years >= self.min_year) & (years <= self.max_year)] - self.min_year
+        self.counts += np.bincount(slots, minlength=len(self.counts))
+    
+    def add_corpus(self, corpus: ParsedCorpus, work_ids: np.ndarray = None,
+                   chunk_size: int = RPYS_CHUNK_SIZE):
+        """
+        Fold every cited-reference occurrence of a parsed corpus.
+        
+        work_ids maps each distinct reference string to its cited-work ID
+        (default: corpus.cited.canonical_ids); pass raw IDs from a shared
+        ReferenceInterner when adding several batches, and its
+        canonical_ids() as work_map when reporting.
+        """
+        # Reference years parsed once per distinct reference string
+        refs = corpus.references
+        year_of_ref = corpus.cited.year
+        for lo in range(0, len(refs.values), chunk_size):
+            self.add(year_of_ref[refs.values[lo:lo + chunk_size]])
+        
+        if work_ids is None:
+            work_ids = corpus.cited.canonical_ids
+        
+        # Citations per (year, work), from occurrences per distinct string
+        occurrences = np.bincount(refs.values, minlength=len(refs.names))
+        strings = np.flatnonzero(
+            (occurrences > 0) & (year_of_ref >= self.min_year) & (year_of_ref <= self.max_year)
+        )
+        pairs, first, inverse = np.unique(
+            np.stack([year_of_ref[strings].astype(np.int64), work_ids[strings].astype(np.int64)], axis=1),
+            axis=0, return_index=True, return_inverse=True
+        )
+        totals = np.bincount(inverse.ravel(), weights=occurrences[strings], minlength=len(pairs))
+        
+        # Buckets in first-seen order so that ties keep the earliest work
+        for i in np.argsort(first, kind='stable').tolist():
+            year, work = int(pairs[i, 0]), int(pairs[i, 1])
+            self.work_counts[year][work] += int(totals[i])
+            if (year, work) not in self.work_labels:
+                self.work_labels[(year, work)] = refs.names[strings[first[i]]][:80]
+    
+    def top_references(self, year: int, k: int = None, work_map: np.ndarray = None) -> list:
+        """
+        (reference, citations) of the k most cited works of a year.
+        
+        work_map merges work IDs first (see ReferenceInterner.canonical_ids);
+        a merged work is labelled by its earliest-seen member in that year.
+        """
+        bucket = self.work_counts.get(year)
+        if not bucket:
+            return []
+        labels = {work: self.work_labels[(year, work)] for work in bucket}
+        if work_map is not None:
+            merged = {}
+            merged_labels = {}
+            for work, count in bucket.items():
+                canonical = int(work_map[work])
+                merged[canonical] = merged.get(canonical, 0) + count
+                merged_labels.setdefault(canonical, labels[work])
+            bucket, labels = merged, merged_labels
+        top = heapq.nlargest(k or self.top_k, bucket.items(), key=lambda item: item[1])
+        return [(labels[work], count) for work, count in top]
+    
+    def spectrum(self) -> tuple:
+        """(years, counts) over the span between the first and last cited year."""
+        cited = np.flatnonzero(self.counts)
+        if len(cited) == 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        lo, hi = cited[0], cited[-1] + 1
+        return np.arange(self.min_year + lo, self.min_year + hi), self.counts[lo:hi]
+
+
+def rolling_median(values: np.ndarray, window: int = RPYS_WINDOW) -> np.ndarray:
+    """
+    Centered moving median along the last axis (each row of a matrix is its
+    own series); windows are truncated at both ends of the series.
+    """
+    values = np.asarray(values, dtype=float)
+    half = window // 2
+    padded = np.pad(values, [(0, 0)] * (values.ndim - 1) + [(half, half)], constant_values=np.nan)
+    windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * half + 1, axis=-1)
+    return np.nanmedian(windows, axis=-1)
 
 
-def analyze_rpys(df: pd.DataFrame, output_dir: str) -> pd.DataFrame:
+def rpys_from_histogram(histogram: ReferenceYearHistogram, output_dir: str,
+                        work_map: np.ndarray = None) -> pd.DataFrame:
     """
-    Reference Publication Year Spectroscopy (RPYS).
-    
-    Analyzes the publication years of cited references to identify
-    historical roots and seminal works in the field.
-    
-    Based on: Marx et al. (2014) - Detecting the historical roots of research fields
+    Compute, export and plot the RPYS spectrum from a reference-year histogram
+    (work_map: see ReferenceYearHistogram.top_references).
     """
-    print("\n" + "=" * 70)
-    print("RPYS - REFERENCE PUBLICATION YEAR SPECTROSCOPY")
-    print("=" * 70)
-    
-    # Extract all reference years
-    ref_years = []
-    ref_by_year = defaultdict(list)
+    total_refs = histogram.total
     
-    for _, row in df.iterrows():
-        cr_field = row.get('CR', '')
-        if pd.isna(cr_field) or not cr_field:
-            continue
-        
-        refs = str(cr_field).split(';')
-        for ref in refs:
-            ref = ref.strip()
-            if not ref:
-                continue
-            year = extract_reference_year(ref)
-            if year:
-                ref_years.append(year)
-                # Store first 80 chars of reference for later identification
-                ref_by_year[year].append(ref[:80])
     
-    if len(ref_years) < 100:
+    if total_refs < 100:
         print("  Insufficient reference data for RPYS analysis")
         return pd.DataFrame()
     
-    print(f"  Total cited references analyzed: {len(ref_years)}")
-    
-    # Count references per year
-    year_counts = Counter(ref_years)
-    min_year = min(year_counts.keys())
-    max_year = max(year_counts.keys())
+    print(f"  Total cited references analyzed: {total_refs}")
     
-    # Create continuous year series
-    years = list(range(min_year, max_year + 1))
-    counts = [year_counts.get(y, 0) for y in years]
+    # Continuous year series between the first and last cited year
+    years, counts = histogram.spectrum()
     
-    # Calculate 5-year moving median
-    window = 5
-    median_values = []
-    for i in range(len(counts)):
-        start = max(0, i - window // 2)
-        end = min(len(counts), i + window // 2 + 1)
-        median_values.append(np.median(counts[start:end]))
-    
-    # Calculate deviation (spectroscopy signal)
-    deviations = [counts[i] - median_values[i] for i in range(len(counts))]
+    # Moving median and deviation (spectroscopy signal)
+    median_values = rolling_median(counts)
+    deviations = counts - median_values
     
     # Identify peaks (years with deviation > mean + 1.5*std)
     dev_mean = np.mean(deviations)
@@ -1329,21 +2775,15 @@ def analyze_rpys(df: pd.DataFrame, output_dir: str) -> pd.DataFrame:
     peak_threshold = dev_mean + 1.5 * dev_std
     
     # Build results dataframe
-    results = []
-    for i, year in enumerate(years):
-        is_peak = deviations[i] > peak_threshold
-        top_refs = ref_by_year.get(year, [])[:3]  # Top 3 references for that year
-        
-        results.append({
-            'Year': year,
-            'N_Citations': counts[i],
-            'Median_5yr': round(median_values[i], 1),
-            'Deviation': round(deviations[i], 1),
-            'Is_Peak': is_peak,
-            'Top_References': ' | '.join(top_refs) if top_refs else ''
-        })
-    
-    rpys_df = pd.DataFrame(results)
+    rpys_df = pd.DataFrame({
+        'Year': years,
+        'N_Citations': counts,
+        'Median_5yr': median_values.round(1),
+        'Deviation': deviations.round(1),
+        'Is_Peak': deviations > peak_threshold,
+        'Top_References': [' | '.join(ref for ref, _ in histogram.top_references(year, work_map=work_map))
+                           for year in years.tolist()]
+    })
     
     # Export CSV
     csv_path = os.path.join(output_dir, 'historical_roots.csv')
@@ -1355,6 +2795,8 @@ def analyze_rpys(df: pd.DataFrame, output_dir: str) -> pd.DataFrame:
     print(f"\n  Peak Years (Historical Roots):")
     for _, row in peaks.head(10).iterrows():
         print(f"    {int(row['Year'])}: {int(row['N_Citations'])} citations (deviation: +{row['Deviation']:.0f})")
+        for ref, count in histogram.top_references(int(row['Year']), 1, work_map):
+            print(f"      Most cited: {ref} ({count})")
     
     # Generate plot if matplotlib available
     if MATPLOTLIB_AVAILABLE:
@@ -1399,6 +2841,124 @@ def analyze_rpys(df: pd.DataFrame, output_dir: str) -> pd.DataFrame:
     return rpys_df
 
 
+def reference_year_matrix(corpus: ParsedCorpus, chunk_size: int = RPYS_CHUNK_SIZE) -> tuple:
+    """
+    Count cited references per citing year and cited year in one pass.
+    
+    Returns:
+        (citing_years, counts): sorted publication years of the citing
+        records and a dense int64 matrix with one row per citing year and one
+        column per cited year in RPYS_MIN_YEAR..RPYS_MAX_YEAR
+    """
+    refs = corpus.references
+    citing_of_record = corpus.years
+    citing_years = np.unique(citing_of_record[citing_of_record > 0])
+    n_cited = RPYS_MAX_YEAR - RPYS_MIN_YEAR + 1
+    
+    counts = np.zeros(len(citing_years) * n_cited, dtype=np.int64)
+    for lo in range(0, len(refs.values), chunk_size):
+        positions = np.arange(lo, min(lo + chunk_size, len(refs.values)))
+        records = np.searchsorted(refs.offsets, positions, side='right') - 1
+        cited = corpus.cited.year[refs.values[positions]].astype(np.int64)
+        citing = citing_of_record[records]
+        valid = (cited >= RPYS_MIN_YEAR) & (cited <= RPYS_MAX_YEAR) & (citing > 0)
+        rows = np.searchsorted(citing_years, citing[valid])
+        counts += np.bincount(rows * n_cited + cited[valid] - RPYS_MIN_YEAR, minlength=len(counts))
+    
+    return citing_years, counts.reshape(len(citing_years), n_cited)
+
+
+def analyze_multi_rpys(df: pd.DataFrame, output_dir: str, corpus: ParsedCorpus = None) -> pd.DataFrame:
+    """
+    Multi-RPYS: one RPYS spectrum per citing year.
+    
+    Each row of the citing-year x cited-year matrix gets its own deviation
+    from the moving median, rank-transformed within the row so that citing
+    years of very different sizes are comparable.
+    
+    Based on: Comins & Leydesdorff (2016) - RPYS i/o and multi-RPYS
+    """
+    print("\n" + "=" * 70)
+    print("MULTI-RPYS - SPECTROGRAM BY CITING YEAR")
+    print("=" * 70)
+    
+    if corpus is None:
+        corpus = ParsedCorpus(df)
+    
+    citing_years, counts = reference_year_matrix(corpus)
+    
+    return multi_rpys_from_counts(citing_years, counts, output_dir)
+
+
+def multi_rpys_from_counts(citing_years: np.ndarray, counts: np.ndarray, output_dir: str) -> pd.DataFrame:
+    """Compute, export and plot the multi-RPYS spectrogram from a citing x cited year count matrix."""
+    # Keep citing years with references and the span between the first and last cited year
+    has_refs = counts.sum(axis=1) > 0
+    citing_years, counts = citing_years[has_refs], counts[has_refs]
+    cited = np.flatnonzero(counts.sum(axis=0))
+    
+    if len(citing_years) < 2 or counts.sum() < 100:
+        print("  Insufficient reference data for multi-RPYS analysis")
+        return pd.DataFrame()
+    
+    lo, hi = cited[0], cited[-1] + 1
+    counts = counts[:, lo:hi]
+    cited_years = np.arange(RPYS_MIN_YEAR + lo, RPYS_MIN_YEAR + hi)
+    print(f"  Spectrogram: {len(citing_years)} citing years x {len(cited_years)} cited years")
+    
+    # Row-wise deviation from the moving median, then percentile rank within each row
+    median_values = rolling_median(counts)
+    deviations = counts - median_values
+    ranks = stats.rankdata(deviations, axis=1) / deviations.shape[1]
+    
+    n_citing, n_cited = counts.shape
+    multi_df = pd.DataFrame({
+        'Citing_Year': np.repeat(citing_years, n_cited),
+        'Cited_Year': np.tile(cited_years, n_citing),
+        'N_Citations': counts.ravel(),
+        'Median_5yr': median_values.ravel().round(1),
+        'Deviation': deviations.ravel().round(1),
+        'Rank': ranks.ravel().round(4)
+    })
+    
+    # Export CSV
+    csv_path = os.path.join(output_dir, 'multi_rpys.csv')
+    multi_df.to_csv(csv_path, index=False)
+    print(f"\n  ✓ Multi-RPYS matrix exported to: {csv_path}")
+    
+    # Persistent roots: cited years ranked highly across citing years
+    mean_rank = ranks.mean(axis=0)
+    print(f"\n  Persistent Peak Years (mean row rank):")
+    for i in np.argsort(-mean_rank, kind='stable')[:10].tolist():
+        print(f"    {int(cited_years[i])}: {mean_rank[i]:.2f}")
+    
+    # Generate heatmap if matplotlib available
+    if MATPLOTLIB_AVAILABLE:
+        try:
+            fig, ax = plt.subplots(figsize=(14, max(4, 0.25 * n_citing + 2)))
+            image = ax.imshow(ranks, aspect='auto', origin='lower', cmap='RdBu_r', vmin=0, vmax=1,
+                              interpolation='nearest',
+                              extent=(cited_years[0] - 0.5, cited_years[-1] + 0.5,
+                                      citing_years[0] - 0.5, citing_years[-1] + 0.5))
+            if n_citing <= 40:
+                ax.set_yticks(citing_years)
+            ax.set_xlabel('Publication Year of Cited Reference', fontsize=12)
+            ax.set_ylabel('Publication Year of Citing Paper', fontsize=12)
+            ax.set_title('Multi-RPYS - Rank of Deviation from 5-year Median per Citing Year',
+                         fontsize=14, fontweight='bold')
+            fig.colorbar(image, ax=ax, label='Deviation Rank (row percentile)')
+            
+            plt.tight_layout()
+            pdf_path = os.path.join(output_dir, 'multi_rpys_heatmap.pdf')
+            plt.savefig(pdf_path, format='pdf', dpi=150, bbox_inches='tight')
+            plt.close()
+            print(f"  ✓ Multi-RPYS heatmap saved to: {pdf_path}")
+        except Exception as e:
+            print(f"  Warning: Could not generate multi-RPYS heatmap: {e}")
+    
+    return multi_df
+
+
 # =============================================================================
 # MAIN PATH ANALYSIS
 # =============================================================================
@@ -1410,6 +2970,8 @@ def match_reference_to_paper(ref_string: str, papers_index: dict, doi_index: dic
     
     Handles both WoS format: "Amit R, 1998, J BUS VENTURING, V13, P441, DOI 10.1016/..."
     And Scopus format: "Abreu, Maria A., The entrepreneurial university..."
+    
+    Scans papers_index linearly; use ReferenceResolver for repeated lookups.
     """
     if pd.isna(ref_string) or not ref_string:
         return None
@@ -1419,14 +2981,14 @@ def match_reference_to_paper(ref_string: str, papers_index: dict, doi_index: dic
     
     # Strategy 1: Try to match by DOI (most reliable)
     if doi_index:
-        doi_match = re.search(r'10\.\d{4,}/[^\s,;]+', ref_str, re.IGNORECASE)
+        doi_match = DOI_PATTERN.search(ref_str)
         if doi_match:
             doi_normalized = doi_match.group(0).lower().strip()
             if doi_normalized in doi_index:
                 return doi_index[doi_normalized]
     
     # Strategy 2: Extract year from reference
-    year_match = re.search(r'\b(19\d{2}|20\d{2})\b', ref_upper)
+    year_match = REF_YEAR_PATTERN.search(ref_upper)
     if not year_match:
         return None
     year = year_match.group(1)
@@ -1445,7 +3007,7 @@ def match_reference_to_paper(ref_string: str, papers_index: dict, doi_index: dic
         return papers_index[key]
     
     # Pattern B: Extract just the surname (before any initials/spaces)
-    surname_match = re.match(r'^([A-Z][A-Z\'\-]+)', first_part)
+    surname_match = SURNAME_PATTERN.match(first_part)
     if surname_match:
         surname = surname_match.group(1)
         # Try with just surname
@@ -1465,44 +3027,152 @@ def match_reference_to_paper(ref_string: str, papers_index: dict, doi_index: dic
     return None
 
 
-def analyze_main_path(df: pd.DataFrame, output_dir: str, n_papers: int = 20) -> pd.DataFrame:
+class ReferenceResolver:
     """
-    Main Path Analysis using citation network.
+    Prebuilt index for resolving cited-reference strings to dataset papers.
     
-    Identifies the main trajectory of knowledge flow through the field
-    by analyzing which papers cite which others.
+    Applies the same strategies, in the same priority order, as
+    match_reference_to_paper (DOI, exact author+year key, surname prefix,
+    Scopus-style full first part), but replaces the linear scan over
+    papers_index with a per-year sorted key list. Prefix queries are answered
+    by bisection and memoized, so repeated lookups cost roughly constant time.
+    """
     
-    Based on: Hummon & Dereian (1989), Liu & Lu (2012)
+    def __init__(self, papers_index: dict, doi_index: dict = None):
+        self.papers_index = papers_index
+        self.doi_index = doi_index or {}
+        
+        # Group keys by their "_YEAR" suffix, keeping insertion order so the
+        # first matching key wins exactly as in the linear scan
+        by_year = defaultdict(list)
+        for order, key in enumerate(papers_index):
+            if '_' in key:
+                by_year[key.rsplit('_', 1)[1]].append((key, order))
+        
+        self._year_keys = {}
+        self._year_orders = {}
+        for year, entries in by_year.items():
+            entries.sort()
+            self._year_keys[year] = [key for key, _ in entries]
+            self._year_orders[year] = [order for _, order in entries]
+        
+        self._ordered_values = list(papers_index.values())
+        self._prefix_cache = {}
+    
+    def _prefix_lookup(self, year: str, prefix: str) -> str:
+        """Return the first-inserted paper whose key starts with prefix and ends with _year."""
+        cache_key = (year, prefix)
+        if cache_key in self._prefix_cache:
+            return self._prefix_cache[cache_key]
+        
+        result = None
+        keys = self._year_keys.get(year)
+        if keys:
+            orders = self._year_orders[year]
+            best = None
+            i = bisect_left(keys, prefix)
+            while i < len(keys) and keys[i].startswith(prefix):
+                if best is None or orders[i] < best:
+                    best = orders[i]
+                i += 1
+            if best is not None:
+                result = self._ordered_values[best]
+        
+        self._prefix_cache[cache_key] = result
+        return result
+    
+    def resolve(self, ref_string: str) -> str:
+        """Return paper ID (UT) for a reference string, or None if unmatched."""
+        if pd.isna(ref_string) or not ref_string:
+            return None
+        
+        parsed = parse_cited_reference(ref_string)
+        return self.resolve_fields(parsed['doi'], parsed['year'], parsed['first_author'],
+                                   parsed['surname'], parsed['multi_field'])
+    
+    def resolve_all(self, cited: CitedReferences) -> list:
+        """Resolve every parsed reference; returns UT or None per reference."""
+        return [
+            self.resolve_fields(doi, year, first_author, surname, multi_field)
+            for doi, year, first_author, surname, multi_field in zip(
+                cited.doi, cited.year.tolist(), cited.first_author, cited.surname, cited.multi_field
+            )
+        ]
+    
+    def resolve_canonical(self, cited: CitedReferences) -> list:
+        """
+        Resolve every canonical reference ID; returns UT or None per ID.
+        
+        An ID takes the first match among its variant strings, so a variant
+        that fails to resolve still links through one that does.
+        """
+        resolved = [None] * cited.n_canonical
+        for ref_id, cited_ut in zip(cited.canonical_ids.tolist(), self.resolve_all(cited)):
+            if cited_ut and resolved[ref_id] is None:
+                resolved[ref_id] = cited_ut
+        return resolved
+    
+    def resolve_fields(self, doi: str, year: int, first_author: str, surname: str,
+                       multi_field: bool) -> str:
+        """Resolve one reference from its parsed fields (see parse_cited_reference)."""
+        # Strategy 1: DOI
+        if doi and doi in self.doi_index:
+            return self.doi_index[doi]
+        
+        # Strategy 2: Year
+        if not year:
+            return None
+        year = str(year)
+        
+        # Strategy 3: Exact first author + year key
+        key = f"{first_author}_{year}"
+        if key in self.papers_index:
+            return self.papers_index[key]
+        
+        # Pattern B: Surname prefix
+        if surname:
+            matched = self._prefix_lookup(year, surname)
+            if matched:
+                return matched
+        
+        # Pattern C: Scopus format "Lastname, Firstname"
+        if multi_field and first_author:
+            matched = self._prefix_lookup(year, first_author)
+            if matched:
+                return matched
+        
+        return None
+
+
+def build_paper_index(df: pd.DataFrame, corpus: ParsedCorpus = None) -> tuple:
     """
-    print("\n" + "=" * 70)
-    print("MAIN PATH ANALYSIS")
-    print("=" * 70)
+    Build the lookup structures used to resolve references to dataset papers.
+    
+    Returns:
+        (papers_index, doi_index, paper_info) where papers_index maps
+        "FIRST AUTHOR_YEAR" and "SURNAME_YEAR" keys to UT, doi_index maps
+        normalized DOIs to UT and paper_info holds per-paper node attributes.
+    """
+    if corpus is None:
+        corpus = ParsedCorpus(df)
     
-    # Build paper index for matching
     papers_index = {}
-    doi_index = {}  # New: DOI-based index for more reliable matching
+    doi_index = {}
     paper_info = {}
     
-    for _, row in df.iterrows():
-        ut = row.get('UT', '')
+    def column(name):
+        return df[name].tolist() if name in df.columns else [None] * corpus.n_records
+    
+    for i, (ut, ti, doi) in enumerate(zip(column('UT'), column('TI'), column('DI'))):
         if pd.isna(ut) or not ut:
             continue
         
-        authors = parse_authors(row.get('AU', ''))
-        try:
-            year = int(float(row.get('PY', 0)))
-        except:
-            year = 0
-        
-        title = str(row.get('TI', ''))[:100] if pd.notna(row.get('TI')) else ''
-        
-        try:
-            citations = int(float(row.get('TC', 0))) if pd.notna(row.get('TC')) else 0
-        except:
-            citations = 0
+        authors = corpus.authors.tokens(i)
+        year = int(corpus.years[i])
+        title = str(ti)[:100] if pd.notna(ti) else ''
+        citations = int(corpus.citations[i])
         
         # Get DOI for index
-        doi = row.get('DI', '')
         if pd.notna(doi) and doi:
             doi_normalized = str(doi).lower().strip()
             doi_index[doi_normalized] = ut
@@ -1527,6 +3197,206 @@ def analyze_main_path(df: pd.DataFrame, output_dir: str, n_papers: int = 20) ->
                 if surname_key not in papers_index:
                     papers_index[surname_key] = ut
     
+    return papers_index, doi_index, paper_info
+
+
+def make_citation_dag(G: nx.DiGraph) -> dict:
+    """
+    Remove the citation links that make G cyclic, in place.
+    
+    Fuzzy reference matching can link a paper to a same-year or later one.
+    Links whose cited paper is newer than the citing paper are dropped
+    first (papers without a year are kept). Cycles left among same-year
+    papers are broken inside each strongly connected component by keeping
+    only links from a later to an earlier paper in (year, node ID) order,
+    so the result is deterministic. Runs in linear time apart from sorting
+    the nodes of each component.
+    
+    Returns:
+        {'forward_in_time': links dropped by year, 'cycles': links dropped
+        to break the remaining cycles}
+    """
+    years = nx.get_node_attributes(G, 'year')
+    forward = [(u, v) for u, v in G.edges()
+               if years.get(u) and years.get(v) and years[v] > years[u]]
+    G.remove_edges_from(forward)
+    
+    cyclic = []
+    for component in nx.strongly_connected_components(G):
+        if len(component) < 2:
+            continue
+        order = {node: i for i, node in enumerate(sorted(component, key=lambda n: (years.get(n) or 0, str(n))))}
+        cyclic.extend((u, v) for u in component for v in G.succ[u]
+                      if v in order and order[v] > order[u])
+    G.remove_edges_from(cyclic)
+    
+    return {'forward_in_time': len(forward), 'cycles': len(cyclic)}
+
+
+def search_path_weights(G: nx.DiGraph, method: str = MAIN_PATH_WEIGHT) -> dict:
+    """
+    Search path weight of every edge of a citation DAG, as the fraction of
+    all search paths that traverse it.
+    
+    Edges point from citing to cited paper; knowledge flows the other way,
+    from papers citing none of the network (flow sources) to papers not
+    cited within it (flow sinks). SPC counts the source-to-sink paths
+    through each edge; SPLC (Liu & Lu, 2012) also counts paths starting at
+    any paper, i.e. every ancestor in the knowledge-flow direction. An
+    edge's count is the product of the paths reaching its cited paper and
+    the paths leaving its citing paper in the flow direction, computed in
+    two passes over a topological order. Counts grow exponentially with
+    the network depth, so both passes run in log space.
+    
+    Example (knowledge flow a->c, b->c, c->d, c->e; edges citing->cited):
+    
+    >>> G = nx.DiGraph([('c', 'a'), ('c', 'b'), ('d', 'c'), ('e', 'c')])
+    >>> spc = search_path_weights(G, 'spc')    # 4 paths: a|b -> c -> d|e
+    >>> round(spc[('c', 'a')] * 4), round(spc[('d', 'c')] * 4)
+    (2, 2)
+    >>> splc = search_path_weights(G, 'splc')  # 6 paths, also c -> d|e
+    >>> round(splc[('c', 'a')] * 6), round(splc[('d', 'c')] * 6)
+    (2, 3)
+    
+    Raises nx.NetworkXUnfeasible if G contains a cycle.
+    """
+    order = list(nx.topological_sort(G))
+    
+    def log_sum(logs, origin):
+        values = np.fromiter(logs, dtype=float)
+        if origin:
+            values = np.append(values, 0.0)
+        return np.logaddexp.reduce(values) if len(values) else -np.inf
+    
+    # Flow paths from the newest papers down to each node (log)
+    log_from_sinks = {}
+    for node in order:
+        preds = G.pred[node]
+        log_from_sinks[node] = log_sum((log_from_sinks[p] for p in preds), origin=not preds)
+    
+    # Flow paths from the flow sources (SPC) or from any ancestor (SPLC) up to each node (log)
+    log_from_sources = {}
+    for node in reversed(order):
+        succ = G.succ[node]
+        log_from_sources[node] = log_sum((log_from_sources[c] for c in succ),
+                                         origin=method == 'splc' or not succ)
+    
+    # Every search path ends with a link into a flow sink
+    sinks = [node for node in G if G.in_degree(node) == 0]
+    log_total = log_sum((log_from_sources[c] for node in sinks for c in G.succ[node]), origin=False)
+    
+    return {(u, v): float(np.exp(log_from_sinks[u] + log_from_sources[v] - log_total))
+            for u, v in G.edges()}
+
+
+def follow_heaviest_edges(G: nx.DiGraph, weights: dict, node, forward: bool = True) -> list:
+    """Edges of the greedy path from node to a sink (forward) or back to a source."""
+    path = []
+    while True:
+        if forward:
+            edges = [(node, v) for v in G.succ[node]]
+        else:
+            edges = [(u, node) for u in G.pred[node]]
+        if not edges:
+            return path
+        edge = max(edges, key=weights.get)
+        path.append(edge)
+        node = edge[1] if forward else edge[0]
+
+
+def local_main_path(G: nx.DiGraph, weights: dict) -> list:
+    """
+    Forward local main path along the knowledge flow: the heaviest link out
+    of a flow source (a paper citing none of the network), then the heaviest
+    next link until a flow sink. Edges are returned newest first, like the
+    other main paths.
+    """
+    source_edges = [(u, v) for v in G if G.out_degree(v) == 0 for u in G.pred[v]]
+    if not source_edges:
+        return []
+    first = max(source_edges, key=weights.get)
+    return ([first] + follow_heaviest_edges(G, weights, first[0], forward=False))[::-1]
+
+
+def global_main_path(G: nx.DiGraph, weights: dict) -> list:
+    """Source-to-sink path with the largest total search path weight (one topological pass)."""
+    best = {}
+    back = {}
+    for node in nx.topological_sort(G):
+        preds = G.pred[node]
+        if preds:
+            parent = max(preds, key=lambda p: best[p] + weights[(p, node)])
+            best[node] = best[parent] + weights[(parent, node)]
+            back[node] = parent
+        else:
+            best[node] = 0.0
+    
+    sinks = [node for node in G if G.out_degree(node) == 0 and node in back]
+    if not sinks:
+        return []
+    node = max(sinks, key=best.get)
+    path = []
+    while node in back:
+        path.append((back[node], node))
+        node = back[node]
+    return path[::-1]
+
+
+def key_route_main_path(G: nx.DiGraph, weights: dict, n_routes: int = MAIN_PATH_KEY_ROUTES) -> list:
+    """
+    Key-route main path: the n_routes heaviest edges, each extended greedily
+    back to a source and forward to a sink; returns the union of their edges.
+    """
+    edges = {}
+    for u, v in heapq.nlargest(n_routes, weights, key=weights.get):
+        route = follow_heaviest_edges(G, weights, u, forward=False)[::-1] + [(u, v)]
+        route += follow_heaviest_edges(G, weights, v)
+        edges.update(dict.fromkeys(route))
+    return list(edges)
+
+
+def extract_main_paths(G: nx.DiGraph, method: str = MAIN_PATH_WEIGHT,
+                       n_routes: int = MAIN_PATH_KEY_ROUTES) -> tuple:
+    """
+    Search path weights and the local, global and key-route main paths.
+    
+    Returns:
+        (weights, {path type: list of (citing, cited) edges})
+    """
+    weights = search_path_weights(G, method)
+    paths = {
+        'local': local_main_path(G, weights),
+        'global': global_main_path(G, weights),
+        'key-route': key_route_main_path(G, weights, n_routes)
+    }
+    return weights, paths
+
+
+def analyze_main_path(df: pd.DataFrame, output_dir: str, corpus: ParsedCorpus = None,
+                      method: str = MAIN_PATH_WEIGHT, path_type: str = MAIN_PATH_TYPE,
+                      n_routes: int = MAIN_PATH_KEY_ROUTES) -> pd.DataFrame:
+    """
+    Main Path Analysis using citation network.
+    
+    Identifies the main trajectory of knowledge flow through the field
+    by analyzing which papers cite which others. Citation links are weighted
+    by search path count (SPC or SPLC) and the local, global and key-route
+    main paths are extracted; path_type selects the one reported as
+    main_path_papers.csv and drawn in main_path_evolution.pdf.
+    
+    Based on: Hummon & Dereian (1989), Liu & Lu (2012)
+    """
+    print("\n" + "=" * 70)
+    print("MAIN PATH ANALYSIS")
+    print("=" * 70)
+    
+    if corpus is None:
+        corpus = ParsedCorpus(df)
+    
+    # Build paper index for matching
+    papers_index, doi_index, paper_info = build_paper_index(df, corpus)
+    resolver = ReferenceResolver(papers_index, doi_index)
+    
     print(f"  Papers indexed: {len(paper_info)}")
     print(f"  DOI index entries: {len(doi_index)}")
     
@@ -1537,19 +3407,19 @@ def analyze_main_path(df: pd.DataFrame, output_dir: str, n_papers: int = 20) ->
     for node_id, info in paper_info.items():
         G.add_node(node_id, **info)
     
+    # Resolve each canonical reference once
+    refs = corpus.references
+    canonical_ids = corpus.cited.canonical_ids
+    resolved = resolver.resolve_canonical(corpus.cited)
+    uts = df['UT'].tolist() if 'UT' in df.columns else [None] * corpus.n_records
+    
     citation_count = 0
-    for _, row in df.iterrows():
-        citing_ut = row.get('UT', '')
+    for i, citing_ut in enumerate(uts):
         if pd.isna(citing_ut) or not citing_ut or citing_ut not in paper_info:
             continue
         
-        cr_field = row.get('CR', '')
-        if pd.isna(cr_field) or not cr_field:
-            continue
-        
-        refs = str(cr_field).split(';')
-        for ref in refs:
-            cited_ut = match_reference_to_paper(ref.strip(), papers_index, doi_index)
+        for ref_id in np.unique(canonical_ids[refs.ids(i)]).tolist():
+            cited_ut = resolved[ref_id]
             if cited_ut and cited_ut in paper_info and cited_ut != citing_ut:
                 G.add_edge(citing_ut, cited_ut)
                 citation_count += 1
@@ -1557,42 +3427,57 @@ def analyze_main_path(df: pd.DataFrame, output_dir: str, n_papers: int = 20) ->
     print(f"  Internal citations found: {citation_count}")
     print(f"  Citation network: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
     
+    pruned = make_citation_dag(G)
+    print(f"  Pruned links: {pruned['forward_in_time']} citing a later paper, "
+          f"{pruned['cycles']} breaking same-year cycles ({G.number_of_edges()} remain)")
+    
     if G.number_of_edges() < 10:
         print("  Insufficient internal citations for main path analysis")
         return pd.DataFrame()
     
-    # Calculate node importance using multiple metrics
-    # Combine: in-degree (citations), out-degree (references), betweenness
-    in_degree = dict(G.in_degree())
-    out_degree = dict(G.out_degree())
-    
-    try:
-        betweenness = nx.betweenness_centrality(G)
-    except:
-        betweenness = {n: 0 for n in G.nodes()}
-    
-    # Calculate combined score (normalized)
-    max_in = max(in_degree.values()) if in_degree else 1
-    max_out = max(out_degree.values()) if out_degree else 1
-    max_bet = max(betweenness.values()) if betweenness else 1
-    
-    node_scores = {}
-    for node in G.nodes():
-        info = paper_info.get(node, {})
-        in_norm = in_degree.get(node, 0) / max_in if max_in > 0 else 0
-        out_norm = out_degree.get(node, 0) / max_out if max_out > 0 else 0
-        bet_norm = betweenness.get(node, 0) / max_bet if max_bet > 0 else 0
-        
-        # Weight: citations most important, then betweenness, then out-degree
-        score = 0.5 * in_norm + 0.3 * bet_norm + 0.2 * out_norm
-        node_scores[node] = score
+    weights, paths = extract_main_paths(G, method, n_routes)
+    
+    max_weight = max(weights.values(), default=0.0)
+    if not np.isfinite(max_weight) or max_weight <= 0:
+        max_weight = 1.0
+    label = method.upper()
+    print(f"  Search path weights: {label} (heaviest link on {max_weight:.1%} of search paths)")
+    for name, edges in paths.items():
+        print(f"    {name.capitalize()} main path: {len(edges)} links")
+    
+    # Export the links of every main path
+    edge_rows = []
+    for name, edges in paths.items():
+        for citing, cited in edges:
+            edge_rows.append({
+                'Path': name,
+                'Citing_UT': citing,
+                'Cited_UT': cited,
+                'Citing_Year': paper_info[citing]['year'],
+                'Cited_Year': paper_info[cited]['year'],
+                'Citing_Author': paper_info[citing]['first_author'],
+                'Cited_Author': paper_info[cited]['first_author'],
+                'Weight': weights[(citing, cited)],
+                'Normalized_Weight': round(weights[(citing, cited)] / max_weight, 4)
+            })
+    edges_df = pd.DataFrame(edge_rows)
+    csv_path = os.path.join(output_dir, 'main_path_edges.csv')
+    edges_df.to_csv(csv_path, index=False)
+    print(f"\n  ✓ Main path links exported to: {csv_path}")
+    
+    main_edges = paths.get(path_type, [])
+    if not main_edges:
+        print(f"  No {path_type} main path found")
+        return pd.DataFrame()
     
-    # Select top papers by score
-    top_papers = sorted(node_scores.items(), key=lambda x: x[1], reverse=True)[:n_papers]
+    # Papers on the selected main path, weighted by their heaviest path link
+    path_weight = defaultdict(float)
+    for citing, cited in main_edges:
+        for ut in (citing, cited):
+            path_weight[ut] = max(path_weight[ut], weights[(citing, cited)] / max_weight)
     
-    # Sort chronologically
     main_path_papers = []
-    for ut, score in top_papers:
+    for ut, score in path_weight.items():
         info = paper_info.get(ut, {})
         main_path_papers.append({
             'UT': ut,
@@ -1600,23 +3485,32 @@ def analyze_main_path(df: pd.DataFrame, output_dir: str, n_papers: int = 20) ->
             'First_Author': info.get('first_author', ''),
             'Title': info.get('title', ''),
             'Citations': info.get('citations', 0),
-            'In_Degree': in_degree.get(ut, 0),
-            'Out_Degree': out_degree.get(ut, 0),
-            'Betweenness': round(betweenness.get(ut, 0), 4),
+            'In_Degree': G.in_degree(ut),
+            'Out_Degree': G.out_degree(ut),
             'Path_Score': round(score, 4)
         })
     
     main_path_df = pd.DataFrame(main_path_papers)
-    main_path_df = main_path_df.sort_values('Year', ascending=True).reset_index(drop=True)
+    main_path_df = main_path_df.sort_values('Year', ascending=True, kind='stable').reset_index(drop=True)
     main_path_df.insert(0, 'Rank', range(1, len(main_path_df) + 1))
     
     # Export CSV
     csv_path = os.path.join(output_dir, 'main_path_papers.csv')
     main_path_df.to_csv(csv_path, index=False)
-    print(f"\n  ✓ Main path papers exported to: {csv_path}")
+    print(f"  ✓ Main path papers exported to: {csv_path}")
+    
+    # Export the selected main path for Gephi
+    P = nx.DiGraph(main_path=path_type, search_path_weight=label)
+    for ut in main_path_df['UT']:
+        info = paper_info[ut]
+        P.add_node(ut, label=f"{info['first_author']} ({info['year']})", year=info['year'],
+                   first_author=info['first_author'], title=info['title'], citations=info['citations'])
+    for citing, cited in main_edges:
+        P.add_edge(citing, cited, weight=weights[(citing, cited)])
+    export_network_to_gexf(P, os.path.join(output_dir, 'main_path.gexf'), f"Main Path ({path_type}, {label})")
     
     # Print main path
-    print(f"\n  Main Path Evolution ({n_papers} key papers):")
+    print(f"\n  Main Path Evolution ({path_type}, {len(main_path_df)} papers):")
     for _, row in main_path_df.iterrows():
         print(f"    {int(row['Year'])}: {row['First_Author'][:20]:20} - {row['Title'][:45]}...")
     
@@ -1628,6 +3522,14 @@ def analyze_main_path(df: pd.DataFrame, output_dir: str, n_papers: int = 20) ->
             years = main_path_df['Year'].values
             scores = main_path_df['Path_Score'].values
             citations = main_path_df['Citations'].values
+            position = {ut: i for i, ut in enumerate(main_path_df['UT'])}
+            
+            # Draw the citation links, pointing from cited to citing paper (knowledge flow)
+            for citing, cited in main_edges:
+                ax.annotate('', xy=(years[position[citing]], position[citing]),
+                            xytext=(years[position[cited]], position[cited]),
+                            arrowprops=dict(arrowstyle='->', color='black', alpha=0.4,
+                                            linewidth=0.5 + 2.5 * weights[(citing, cited)] / max_weight))
             
             # Normalize citation sizes for bubble plot
             max_cite = max(citations) if max(citations) > 0 else 1
@@ -1635,28 +3537,23 @@ def analyze_main_path(df: pd.DataFrame, output_dir: str, n_papers: int = 20) ->
             
             # Create scatter plot
             scatter = ax.scatter(years, range(len(years)), s=sizes, 
-                               c=scores, cmap='YlOrRd', alpha=0.7, edgecolors='black')
+                               c=scores, cmap='YlOrRd', alpha=0.7, edgecolors='black', zorder=3)
             
             # Add paper labels
             for i, row in main_path_df.iterrows():
-                label = f"{row['First_Author'][:15]} ({int(row['Year'])})"
-                ax.annotate(label, xy=(row['Year'], i), xytext=(5, 0),
+                label_text = f"{row['First_Author'][:15]} ({int(row['Year'])})"
+                ax.annotate(label_text, xy=(row['Year'], i), xytext=(5, 0),
                            textcoords='offset points', fontsize=8, va='center')
             
-            # Draw connections between consecutive papers
-            for i in range(len(years) - 1):
-                ax.plot([years[i], years[i+1]], [i, i+1], 
-                       'k-', alpha=0.3, linewidth=1)
-            
             ax.set_xlabel('Publication Year', fontsize=12)
             ax.set_ylabel('Chronological Position', fontsize=12)
-            ax.set_title(f'Main Path Evolution - Top {n_papers} Influential Papers', 
+            ax.set_title(f'Main Path Evolution - {path_type.capitalize()} Main Path ({label})', 
                         fontsize=14, fontweight='bold')
             ax.set_yticks([])
             
             # Add colorbar
             cbar = plt.colorbar(scatter)
-            cbar.set_label('Path Importance Score', fontsize=10)
+            cbar.set_label(f'Heaviest Path Link ({label}, normalized)', fontsize=10)
             
             plt.tight_layout()
             pdf_path = os.path.join(output_dir, 'main_path_evolution.pdf')
@@ -1858,6 +3755,364 @@ def analyze_semantic_frontier(df: pd.DataFrame, output_dir: str,
     return results_df
 
 
+# =============================================================================
+# INCREMENTAL UPDATES
+# =============================================================================
+
+class CorpusAggregates:
+    """
+    Persistent count aggregates that can be updated with new records only.
+    
+    Holds everything the keyword, coupling, temporal, burst and RPYS outputs
+    are derived from: keyword counts per year, co-occurrence pair counts per
+    year, author reference sets and the cited-reference year histogram.
+    Ingesting a batch costs O(batch); outputs are then regenerated from the
+    aggregates without revisiting earlier records.
+    """
+    
+    def __init__(self, exclude_year: int = 2026):
+        self.version = AGGREGATES_VERSION
+        self.exclude_year = exclude_year
+        self.files = {}                              # filename -> content fingerprint
+        self.record_keys = set()                     # preprocess_data deduplication keys
+        self.wos_dois = set()
+        self.wos_titles = set()
+        self.scopus_dois = set()
+        self.scopus_titles = set()                   # titles of Scopus records without DOI
+        self.n_records = 0
+        self.record_years = Counter()                # year -> records
+        self.keyword_years = defaultdict(Counter)    # keyword -> {year: records}, 0 = no year
+        self.pair_years = defaultdict(Counter)       # (kw1, kw2) -> {year: records}
+        self.author_papers = Counter()
+        self.author_citations = Counter()
+        self.reference_ids = ReferenceInterner()     # cited reference -> raw ID (see canonical_ids)
+        self.author_refs = defaultdict(set)          # author -> raw reference IDs
+        self.reference_years = ReferenceYearHistogram()
+        self.citing_reference_years = {}             # citing year -> cited-year counts (multi-RPYS row)
+    
+    def ingest(self, data_dir: str, filenames: list, workers: int = LOAD_WORKERS) -> bool:
+        """
+        Load new export files and add their records, mirroring load_combined_data
+        and preprocess_data.
+        
+        Returns False, without modifying the aggregates, if a new WoS record
+        duplicates an already ingested Scopus record; load_combined_data would
+        then drop that Scopus record, so the caller must rebuild from scratch.
+        """
+        wos_files = [f for f in filenames if f.startswith('data-wos-')]
+        scopus_files = [f for f in filenames if f.startswith('data-scopus-')]
+        
+        wos_dfs = read_export_files(data_dir, wos_files, {'sep': '\t'}, workers) if wos_files else []
+        scopus_dfs = read_export_files(data_dir, scopus_files, {}, workers) if scopus_files else []
+        
+        wos_df = pd.concat(wos_dfs, ignore_index=True) if wos_dfs else pd.DataFrame()
+        if not wos_df.empty:
+            wos_df['_source'] = 'WoS'
+        scopus_df = normalize_scopus_columns(pd.concat(scopus_dfs, ignore_index=True)) if scopus_dfs else pd.DataFrame()
+        
+        # Cross-source deduplication (WoS records take priority)
+        wos_dois, wos_titles = set(), set()
+        if not wos_df.empty:
+            wos_dois = set(column_or_empty(wos_df, 'DI').apply(normalize_doi).dropna())
+            wos_titles = set(column_or_empty(wos_df, 'TI').apply(normalize_title).dropna())
+            if wos_dois & self.scopus_dois or wos_titles & self.scopus_titles:
+                return False
+        
+        if not scopus_df.empty:
+            doi_norm = column_or_empty(scopus_df, 'DI').apply(normalize_doi)
+            title_norm = column_or_empty(scopus_df, 'TI').apply(normalize_title)
+            known_dois = self.wos_dois | wos_dois
+            known_titles = self.wos_titles | wos_titles
+            duplicates = (doi_norm.isin(known_dois) & doi_norm.notna()) | \
+                         (doi_norm.isna() & title_norm.isin(known_titles))
+            scopus_df = scopus_df[~duplicates.values]
+            self.scopus_dois |= set(doi_norm[~duplicates].dropna())
+            self.scopus_titles |= set(title_norm[~duplicates & doi_norm.isna()].dropna())
+        
+        self.wos_dois |= wos_dois
+        self.wos_titles |= wos_titles
+        
+        batch = pd.concat([wos_df, scopus_df], ignore_index=True)
+        if batch.empty:
+            return True
+        
+        # Deduplicate against everything ingested so far, then drop the excluded year
+        if 'UT' in batch.columns:
+            keys = [('UT', ut if pd.notna(ut) else None) for ut in batch['UT']]
+        else:
+            keys = [('TI_PY', ti if pd.notna(ti) else None, py if pd.notna(py) else None)
+                    for ti, py in zip(column_or_empty(batch, 'TI'), column_or_empty(batch, 'PY'))]
+        is_new = []
+        for key in keys:
+            is_new.append(key not in self.record_keys)
+            self.record_keys.add(key)
+        batch = batch[is_new]
+        
+        if 'PY' in batch.columns and self.exclude_year is not None:
+            batch = batch[pd.to_numeric(batch['PY'], errors='coerce') != self.exclude_year]
+        
+        print(f"  New unique records: {len(batch)}")
+        self.add_records(batch)
+        return True
+    
+    def add_records(self, df: pd.DataFrame):
+        """Fold already deduplicated and filtered records into the aggregates."""
+        corpus = ParsedCorpus(df)
+        years = corpus.years.tolist()
+        
+        self.n_records += corpus.n_records
+        self.record_years.update(y for y in years if y)
+        
+        cited = corpus.cited
+        batch_ids = np.array(
+            [self.reference_ids.intern(doi, key) for doi, key in zip(cited.doi, cited.keys)], dtype=np.int32
+        )
+        for i, year in enumerate(years):
+            record_keywords = sorted(corpus.keywords.tokens(i))
+            for kw in record_keywords:
+                self.keyword_years[kw][year] += 1
+            for pair in combinations(record_keywords, 2):
+                self.pair_years[pair][year] += 1
+            
+            refs = set(batch_ids[corpus.references.ids(i)].tolist())
+            citations = int(corpus.citations[i])
+            for author in corpus.authors.tokens(i):
+                self.author_papers[author] += 1
+                self.author_citations[author] += citations
+                self.author_refs[author].update(refs)
+        
+        self.reference_years.add_corpus(corpus, batch_ids)
+        for citing_year, row in zip(*reference_year_matrix(corpus)):
+            citing_year = int(citing_year)
+            if citing_year in self.citing_reference_years:
+                self.citing_reference_years[citing_year] += row
+            else:
+                self.citing_reference_years[citing_year] = row
+    
+    def keyword_counts(self, start_year: int = None, end_year: int = None) -> Counter:
+        """Records per keyword, optionally restricted to a year range."""
+        return Counter({
+            kw: total for kw, total in
+            ((kw, sum_year_range(years, start_year, end_year)) for kw, years in self.keyword_years.items())
+            if total > 0
+        })
+    
+    def pair_counts(self, start_year: int = None, end_year: int = None) -> dict:
+        """Co-occurrence counts per keyword pair, optionally restricted to a year range."""
+        counts = {}
+        for pair, years in self.pair_years.items():
+            total = sum_year_range(years, start_year, end_year)
+            if total > 0:
+                counts[pair] = total
+        return counts
+    
+    def keyword_by_year(self) -> dict:
+        """keyword -> {year: records} for records with a publication year."""
+        result = {}
+        for kw, years in self.keyword_years.items():
+            dated = {y: c for y, c in years.items() if y}
+            if dated:
+                result[kw] = dated
+        return result
+    
+    def records_in_range(self, start_year: int, end_year: int) -> int:
+        return sum_year_range(self.record_years, start_year, end_year)
+    
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as fh:
+            pickle.dump(self, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    
+    @staticmethod
+    def load(path: str, exclude_year: int = 2026):
+        """Load saved aggregates, or None if missing or built with other settings."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as fh:
+                aggregates = pickle.load(fh)
+        except Exception as e:
+            print(f"  Warning: Could not read aggregates: {str(e)[:50]}")
+            return None
+        if getattr(aggregates, 'version', None) != AGGREGATES_VERSION or aggregates.exclude_year != exclude_year:
+            return None
+        return aggregates
+
+
+def column_or_empty(df: pd.DataFrame, name: str) -> pd.Series:
+    """Return a column, or an all-missing Series if the export lacks it."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series([None] * len(df), index=df.index, dtype=object)
+
+
+def sum_year_range(year_counts: dict, start_year: int = None, end_year: int = None) -> int:
+    """Sum {year: count} over start_year..end_year (all years, including 0, if unbounded)."""
+    if start_year is None and end_year is None:
+        return sum(year_counts.values())
+    return sum(c for y, c in year_counts.items() if start_year <= y <= end_year)
+
+
+def update_corpus_aggregates(data_dir: str, cache_dir: str, exclude_year: int = 2026,
+                             workers: int = LOAD_WORKERS) -> CorpusAggregates:
+    """
+    Bring the persisted aggregates up to date with the export files in data_dir.
+    
+    Only files not seen before are read. If a previously ingested file changed
+    or disappeared, or new records would displace ingested ones during
+    deduplication, the aggregates are rebuilt from all files.
+    """
+    print("\n" + "=" * 70)
+    print("INCREMENTAL UPDATE")
+    print("=" * 70)
+    
+    path = os.path.join(cache_dir, AGGREGATES_FILE)
+    aggregates = CorpusAggregates.load(path, exclude_year)
+    fingerprints = {f: file_fingerprint(os.path.join(data_dir, f)) for f in list_input_files(data_dir)}
+    
+    if aggregates is not None:
+        changed = [f for f, fp in aggregates.files.items() if fingerprints.get(f) != fp]
+        if changed:
+            print(f"  {len(changed)} previously ingested file(s) changed or removed: rebuilding")
+            aggregates = None
+    
+    if aggregates is None:
+        aggregates = CorpusAggregates(exclude_year)
+    
+    new_files = [f for f in fingerprints if f not in aggregates.files]
+    if not new_files:
+        print(f"  No new export files; {aggregates.n_records} records up to date")
+        return aggregates
+    
+    print(f"  New export files: {len(new_files)}")
+    if not aggregates.ingest(data_dir, new_files, workers):
+        print("  New WoS records duplicate ingested Scopus records: rebuilding")
+        aggregates = CorpusAggregates(exclude_year)
+        new_files = list(fingerprints)
+        aggregates.ingest(data_dir, new_files, workers)
+    
+    aggregates.files.update({f: fingerprints[f] for f in new_files})
+    aggregates.save(path)
+    print(f"  Total records: {aggregates.n_records}")
+    print(f"  ✓ Aggregates saved to: {path}")
+    
+    return aggregates
+
+
+def run_incremental_analysis(aggregates: CorpusAggregates, output_dir: str,
+                             top_keywords: int = TOP_N_KEYWORDS,
+                             backbone_alpha: float = BACKBONE_ALPHA, sweep_alphas: list = None,
+                             betweenness_options: dict = None, community_options: dict = None,
+                             compare_engines: bool = False, burst_engine: str = BURST_ENGINE) -> dict:
+    """
+    Regenerate network, temporal, burst and RPYS outputs from aggregates.
+    
+    Produces the same files as the corresponding steps of a full run.
+    """
+    print("\n" + "=" * 70)
+    print("NETWORK ANALYSES")
+    print("=" * 70)
+    
+    # Keywords Network (enriched)
+    print("\n  Building keyword co-occurrence network...")
+    keyword_network = keyword_cooccurrence_network_from_counts(
+        rank_keywords(aggregates.keyword_counts(), top_keywords), aggregates.pair_counts()
+    )
+    keyword_network = enrich_network_attributes(keyword_network, betweenness_options, community_options)
+    export_network_to_gexf(keyword_network, os.path.join(output_dir, 'keywords_cooccurrence_enriched.gexf'),
+                           "Keywords Co-occurrence (Enriched)")
+    
+    # Normalized Bibliographic Coupling
+    print("\n  Building normalized bibliographic coupling network...")
+    active_authors = sorted(a for a, count in aggregates.author_papers.items() if count >= 2)
+    work_map = aggregates.reference_ids.canonical_ids()
+    indptr = [0]
+    indices = []
+    for author in active_authors:
+        indices.extend(np.unique(work_map[list(aggregates.author_refs[author])]).tolist())
+        indptr.append(len(indices))
+    X = sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.int32), np.array(indices, dtype=np.int32), indptr),
+        shape=(len(active_authors), len(aggregates.reference_ids))
+    )
+    coupling_network = coupling_graph_from_matrix(
+        active_authors,
+        [aggregates.author_papers[a] for a in active_authors],
+        [aggregates.author_citations[a] for a in active_authors],
+        X
+    )
+    coupling_backbone = apply_disparity_filter(coupling_network, backbone_alpha)
+    coupling_giant = extract_giant_component(coupling_backbone)
+    coupling_giant = enrich_network_attributes(coupling_giant, betweenness_options, community_options)
+    export_network_to_gexf(coupling_giant, os.path.join(output_dir, 'bibliographic_coupling_normalized.gexf'),
+                           "Bibliographic Coupling (Normalized)")
+    
+    # Temporal Evolution (Sankey)
+    print("\n" + "=" * 70)
+    print("TEMPORAL EVOLUTION ANALYSIS")
+    print("=" * 70)
+    periods = define_time_periods_from_counts(pd.Series(aggregates.record_years, dtype=int).sort_index())
+    if len(periods) < 2:
+        print("  Insufficient time span for temporal analysis")
+    else:
+        period_networks = []
+        for period in periods:
+            if aggregates.records_in_range(period['start'], period['end']) == 0:
+                period_networks.append((period, nx.Graph(), Counter()))
+                continue
+            keywords = aggregates.keyword_counts(period['start'], period['end'])
+            top = rank_keywords(keywords, min(30, len(keywords)))
+            G = keyword_graph_from_counts(top, aggregates.pair_counts(period['start'], period['end']), 1)
+            period_networks.append((period, G, keywords))
+        temporal_evolution_from_networks(period_networks, output_dir, community_options)
+    
+    # Burst Detection
+    print("\n" + "=" * 70)
+    print("BURST DETECTION")
+    print("=" * 70)
+    if aggregates.record_years:
+        keyword_bursts_from_counts(aggregates.keyword_by_year(), min(aggregates.record_years),
+                                   max(aggregates.record_years), output_dir, engine=burst_engine,
+                                   year_totals=aggregates.record_years)
+    else:
+        print("  No year data available")
+    
+    # Network Statistics
+    networks = {
+        'Keywords_Cooccurrence': keyword_network,
+        'Bibliographic_Coupling_Raw': coupling_network,
+        'Bibliographic_Coupling_Backbone': coupling_giant
+    }
+    calculate_network_statistics(networks, output_dir)
+    if sweep_alphas:
+        sweep_backbone_alphas(coupling_network, sweep_alphas, output_dir, community_options)
+    if compare_engines:
+        options = community_options or {}
+        compare_community_engines(
+            {'Keywords_Cooccurrence': keyword_network, 'Bibliographic_Coupling_Backbone': coupling_giant},
+            output_dir, options.get('resolution', COMMUNITY_RESOLUTION), options.get('seed', COMMUNITY_SEED)
+        )
+    
+    # RPYS - Historical Roots Analysis
+    print("\n" + "=" * 70)
+    print("RPYS - REFERENCE PUBLICATION YEAR SPECTROSCOPY")
+    print("=" * 70)
+    rpys_from_histogram(aggregates.reference_years, output_dir, work_map)
+    
+    print("\n" + "=" * 70)
+    print("MULTI-RPYS - SPECTROGRAM BY CITING YEAR")
+    print("=" * 70)
+    citing_years = sorted(aggregates.citing_reference_years)
+    if citing_years:
+        multi_rpys_from_counts(np.array(citing_years),
+                               np.vstack([aggregates.citing_reference_years[y] for y in citing_years]),
+                               output_dir)
+    
+    return networks
+
+
 # =============================================================================
 # OUTPUT MODULE
 # =============================================================================
@@ -1914,10 +4169,29 @@ def print_summary_statistics(df: pd.DataFrame):
 """)
 
 
+GEXF_GRAPH_ATTRIBUTES = ('modularity', 'community_engine', 'betweenness_mode', 'main_path', 'search_path_weight')
+
+
 def export_network_to_gexf(G: nx.Graph, filepath: str, network_type: str):
-    """Export network to GEXF format for Gephi."""
+    """
+    Export network to GEXF format for Gephi.
+    
+    networkx does not serialize graph-level attributes, so the analysis
+    settings in GEXF_GRAPH_ATTRIBUTES are written to the <meta> description.
+    """
     try:
-        nx.write_gexf(G, filepath)
+        writer = nx.readwrite.gexf.GEXFWriter(encoding='utf-8', prettyprint=True)
+        writer.add_graph(G)
+        
+        graph_attributes = [f"{key}={G.graph[key]}" for key in GEXF_GRAPH_ATTRIBUTES if key in G.graph]
+        meta = writer.xml.find('meta')
+        if graph_attributes and meta is not None:
+            description = meta.find('description')
+            if description is None:
+                description = ElementTree.SubElement(meta, 'description')
+            description.text = '; '.join(graph_attributes)
+        
+        writer.write(filepath)
         print(f"  ✓ {network_type} network exported to: {filepath}")
     except Exception as e:
         print(f"  ✗ Failed to export {network_type}: {str(e)}")
@@ -1938,23 +4212,99 @@ def main():
                         help='Number of top keywords for network')
     parser.add_argument('--backbone-alpha', type=float, default=BACKBONE_ALPHA,
                         help='Significance level for backbone filter')
+    parser.add_argument('--backbone-sweep', type=float, nargs='+', metavar='ALPHA',
+                        help='Also summarize the coupling backbone at these significance levels '
+                             '(backbone_sweep.csv)')
+    parser.add_argument('--betweenness', choices=['auto', 'exact', 'approximate'], default=BETWEENNESS_MODE,
+                        help='Betweenness centrality: exact, sampled pivots, or auto by network size')
+    parser.add_argument('--betweenness-samples', type=int, default=BETWEENNESS_SAMPLES,
+                        help='Pivot nodes (k) for approximate betweenness')
+    parser.add_argument('--betweenness-seed', type=int, default=BETWEENNESS_SEED,
+                        help='Random seed for pivot sampling')
+    parser.add_argument('--betweenness-max-exact-nodes', type=int, default=BETWEENNESS_EXACT_MAX_NODES,
+                        help='Largest network that gets exact betweenness in auto mode')
+    parser.add_argument('--centrality-workers', type=int, default=CENTRALITY_WORKERS,
+                        help='Worker processes for betweenness centrality (1 = serial)')
+    parser.add_argument('--community-engine', choices=COMMUNITY_ENGINES, default=COMMUNITY_ENGINE,
+                        help='Community detection engine (leiden requires leidenalg and igraph)')
+    parser.add_argument('--community-resolution', type=float, default=COMMUNITY_RESOLUTION,
+                        help='Modularity resolution (higher values give smaller communities)')
+    parser.add_argument('--community-seed', type=int, default=COMMUNITY_SEED,
+                        help='Random seed for Louvain/Leiden')
+    parser.add_argument('--compare-community-engines', action='store_true',
+                        help='Report runtime and modularity of every engine (community_engines.csv)')
+    parser.add_argument('--temporal-mode', choices=['periods', 'sliding'], default='periods',
+                        help='Thematic evolution over three volume-based periods or sliding year windows')
+    parser.add_argument('--window-size', type=int, default=WINDOW_SIZE,
+                        help='Years per sliding window')
+    parser.add_argument('--window-stride', type=int, default=WINDOW_STRIDE,
+                        help='Years between consecutive sliding windows')
+    parser.add_argument('--window-volume', type=int, default=None,
+                        help='Equal-volume sliding windows: minimum documents per window '
+                             '(overrides --window-size)')
+    parser.add_argument('--burst-engine', choices=['zscore', 'kleinberg'], default=BURST_ENGINE,
+                        help='Keyword bursts: recent-vs-historical z-scores, or add Kleinberg '
+                             'burst start/end/strength')
+    parser.add_argument('--main-path-weight', choices=['spc', 'splc'], default=MAIN_PATH_WEIGHT,
+                        help='Main path link weights: Search Path Count or Search Path Link Count')
+    parser.add_argument('--main-path', choices=['local', 'global', 'key-route'], default=MAIN_PATH_TYPE,
+                        help='Main path reported in main_path_papers.csv and main_path_evolution.pdf')
+    parser.add_argument('--key-routes', type=int, default=MAIN_PATH_KEY_ROUTES,
+                        help='Heaviest links seeding the key-route main path')
+    parser.add_argument('--cache-dir', type=str, default=DEFAULT_CACHE_DIR,
+                        help='Directory for the preprocessed corpus cache (Arrow IPC)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always re-read and re-preprocess the input exports')
+    parser.add_argument('--workers', type=int, default=LOAD_WORKERS,
+                        help='Worker processes for parsing export files (1 = serial)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Ingest only new export files into the persisted aggregates and '
+                             'regenerate network, temporal, burst and RPYS outputs from them')
     
     args = parser.parse_args()
     
     os.makedirs(args.output_dir, exist_ok=True)
     
+    betweenness_options = {
+        'mode': args.betweenness,
+        'k': args.betweenness_samples,
+        'seed': args.betweenness_seed,
+        'max_exact_nodes': args.betweenness_max_exact_nodes,
+        'workers': args.centrality_workers
+    }
+    
+    if args.community_engine == 'leiden' and not LEIDEN_AVAILABLE:
+        print("Warning: leidenalg/igraph not installed. Using Louvain community detection.")
+    community_options = {
+        'engine': args.community_engine,
+        'resolution': args.community_resolution,
+        'seed': args.community_seed
+    }
+    
     print("\n" + "=" * 70)
     print("   ADVANCED BIBLIOMETRIC ANALYSIS - ACADEMIC ENTREPRENEURSHIP")
     print("   Web of Science + Scopus Consolidated Analysis")
     print("=" * 70)
     
-    # 1. Load data
-    df = load_wos_data(args.data_dir)
-    
-    # 2. Preprocess
-    df = preprocess_data(df)
-    
-    # 3. Summary Statistics
+    if args.incremental:
+        aggregates = update_corpus_aggregates(args.data_dir, args.cache_dir, workers=args.workers)
+        run_incremental_analysis(aggregates, args.output_dir, args.top_keywords, args.backbone_alpha,
+                                 args.backbone_sweep, betweenness_options, community_options,
+                                 args.compare_community_engines, args.burst_engine)
+        print("\n" + "=" * 70)
+        print("INCREMENTAL ANALYSIS COMPLETE")
+        print("=" * 70)
+        print(f"\nOutput files saved to: {os.path.abspath(args.output_dir)}\n")
+        return
+    
+    # 1-2. Load and preprocess data (cached by input content hash)
+    df = load_preprocessed_data(args.data_dir, None if args.no_cache else args.cache_dir,
+                                workers=args.workers)
+    
+    # 3. Parse records once for all analyses
+    corpus = build_parsed_corpus(df)
+    
+    # Summary Statistics
     print_summary_statistics(df)
     
     # 4. Quantitative Analyses
@@ -1968,10 +4318,10 @@ def main():
     sources_df = analyze_top_sources(df)
     print_formatted_table(sources_df, f"TOP {TOP_N_SOURCES} MOST PRODUCTIVE SOURCES")
     
-    authors_df = analyze_top_cited_authors(df)
+    authors_df = analyze_top_cited_authors(df, corpus=corpus)
     print_formatted_table(authors_df, f"TOP {TOP_N_AUTHORS} MOST CITED AUTHORS")
     
-    countries_df, collab_df = analyze_country_collaboration(df)
+    countries_df, collab_df = analyze_country_collaboration(df, corpus)
     print_formatted_table(countries_df, "COUNTRY SCIENTIFIC PRODUCTION (Top 20)")
     print_formatted_table(collab_df, "TOP 10 COUNTRY COLLABORATIONS")
     
@@ -1981,27 +4331,31 @@ def main():
     print("=" * 70)
     
     # 5.1 Keywords Network (enriched)
-    keyword_network = build_keyword_cooccurrence_network(df, args.top_keywords)
-    keyword_network = enrich_network_attributes(keyword_network)
+    keyword_network = build_keyword_cooccurrence_network(df, args.top_keywords, corpus)
+    keyword_network = enrich_network_attributes(keyword_network, betweenness_options, community_options)
     keyword_gexf = os.path.join(args.output_dir, 'keywords_cooccurrence_enriched.gexf')
     export_network_to_gexf(keyword_network, keyword_gexf, "Keywords Co-occurrence (Enriched)")
     
     # 5.2 Normalized Bibliographic Coupling
-    coupling_network = build_normalized_coupling_network(df)
+    coupling_network = build_normalized_coupling_network(df, corpus=corpus)
     coupling_backbone = apply_disparity_filter(coupling_network, args.backbone_alpha)
     coupling_giant = extract_giant_component(coupling_backbone)
-    coupling_giant = enrich_network_attributes(coupling_giant)
+    coupling_giant = enrich_network_attributes(coupling_giant, betweenness_options, community_options)
     coupling_gexf = os.path.join(args.output_dir, 'bibliographic_coupling_normalized.gexf')
     export_network_to_gexf(coupling_giant, coupling_gexf, "Bibliographic Coupling (Normalized)")
     
     # 6. Temporal Evolution (Sankey)
-    sankey_df = analyze_temporal_evolution(df, args.output_dir)
+    if args.temporal_mode == 'sliding':
+        sankey_df = analyze_sliding_evolution(df, args.output_dir, corpus, args.window_size, args.window_stride,
+                                              args.window_volume, community_options)
+    else:
+        sankey_df = analyze_temporal_evolution(df, args.output_dir, corpus, community_options)
     
     # 7. Core Authors by Cluster
-    core_authors_df = identify_core_authors(df, keyword_network, args.output_dir)
+    core_authors_df = identify_core_authors(df, keyword_network, args.output_dir, corpus, community_options)
     
     # 8. Burst Detection
-    burst_df = detect_keyword_bursts(df, args.output_dir)
+    burst_df = detect_keyword_bursts(df, args.output_dir, corpus=corpus, engine=args.burst_engine)
     
     # 9. Network Statistics
     networks = {
@@ -2010,12 +4364,21 @@ def main():
         'Bibliographic_Coupling_Backbone': coupling_giant
     }
     stats_df = calculate_network_statistics(networks, args.output_dir)
+    if args.backbone_sweep:
+        sweep_backbone_alphas(coupling_network, args.backbone_sweep, args.output_dir, community_options)
+    if args.compare_community_engines:
+        compare_community_engines(
+            {'Keywords_Cooccurrence': keyword_network, 'Bibliographic_Coupling_Backbone': coupling_giant},
+            args.output_dir, args.community_resolution, args.community_seed
+        )
     
     # 10. RPYS - Historical Roots Analysis
-    rpys_df = analyze_rpys(df, args.output_dir)
+    rpys_df = analyze_rpys(df, args.output_dir, corpus)
+    multi_rpys_df = analyze_multi_rpys(df, args.output_dir, corpus)
     
     # 11. Main Path Analysis
-    main_path_df = analyze_main_path(df, args.output_dir, n_papers=20)
+    main_path_df = analyze_main_path(df, args.output_dir, corpus=corpus, method=args.main_path_weight,
+                                     path_type=args.main_path, n_routes=args.key_routes)
     
     # 12. Semantic Frontier Analysis (BERTopic)
     # Collect bibliometric keywords for comparison
@@ -2032,16 +4395,20 @@ def main():
     print("\n  Network files (.gexf):")
     print("    - keywords_cooccurrence_enriched.gexf")
     print("    - bibliographic_coupling_normalized.gexf")
+    print("    - main_path.gexf")
     print("\n  Analysis files (.csv):")
     print("    - temporal_evolution_sankey.csv")
     print("    - core_authors_by_cluster.csv")
     print("    - keyword_bursts.csv")
     print("    - network_statistics.csv")
     print("    - historical_roots.csv (RPYS)")
+    print("    - multi_rpys.csv (multi-RPYS)")
     print("    - main_path_papers.csv")
+    print("    - main_path_edges.csv")
     print("    - semantic_topics.csv (BERTopic)")
     print("\n  Visualization files:")
     print("    - rpys_spectroscopy.pdf")
+    print("    - multi_rpys_heatmap.pdf")
     print("    - main_path_evolution.pdf")
     print("    - semantic_intertopic_distance.html")
     print("    - semantic_topics_barchart.html")
@@ -178,6 +178,18 @@ def preprocess_data(df: pd.DataFrame, exclude_year: int = 2026) -> pd.DataFrame:
     return df
 
 
+def load_preprocessed_data(data_dir: str) -> pd.DataFrame:
+    """Load and preprocess data, sharing the corpus cache of bibliometric_analysis."""
+    try:
+        from bibliometric_analysis import load_preprocessed_data as load_cached
+        return load_cached(data_dir)
+    except ImportError:
+        print("  Warning: Could not import corpus cache, loading without cache")
+    
+    df = load_wos_data(data_dir)
+    return preprocess_data(df)
+
+
 # =============================================================================
 # TEXT PREPROCESSING
 # =============================================================================
@@ -518,9 +530,8 @@ def run_lda_analysis():
     
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
-    # 1. Load and preprocess data
-    df = load_wos_data(DATA_DIR)
-    df = preprocess_data(df)
+    # 1. Load and preprocess data (cached by input content hash)
+    df = load_preprocessed_data(DATA_DIR)
     
     # 2. Preprocess abstracts
     abstracts, doc_indices, doc_titles = preprocess_abstracts(df)